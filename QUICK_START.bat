@@ -24,6 +24,7 @@ pip install -r requirements.txt
 echo.
 echo Step 4: Running web scraper...
 python backend\scraper\scrape_legal_data.py
+python backend\scraper\scrape_legal_data.py --compact
 
 echo.
 echo ========================================
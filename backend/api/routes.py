@@ -8,7 +8,7 @@ import uuid
 from backend.models.schemas import (
     ChatRequest, ChatResponse, HealthResponse
 )
-from backend.services.legal_knowledge import get_legal_response, LEGAL_KNOWLEDGE
+from backend.services.legal_knowledge import get_legal_response, LEGAL_KNOWLEDGE, BY_CATEGORY
 
 
 router = APIRouter()
@@ -73,7 +73,7 @@ async def initialize_knowledge_base():
             "stats": {
                 "loaded": True,
                 "count": len(LEGAL_KNOWLEDGE),
-                "categories": list(set([entry["category"] for entry in LEGAL_KNOWLEDGE])),
+                "categories": list(BY_CATEGORY),
                 "method": "Pattern Matching (Manual Curation)"
             }
         }
@@ -89,10 +89,7 @@ async def get_stats():
     total_keywords = sum(len(entry["keywords"]) for entry in LEGAL_KNOWLEDGE)
     
     # Get categories
-    categories = {}
-    for entry in LEGAL_KNOWLEDGE:
-        cat = entry["category"]
-        categories[cat] = categories.get(cat, 0) + 1
+    categories = {cat: len(entries) for cat, entries in BY_CATEGORY.items()}
     
     return {
         "status": "operational",
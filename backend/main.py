@@ -15,13 +15,36 @@ if sys.platform == "win32":
     except:
         pass
 
-# Add project root to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add project root to Python path (resolved once, inserted only if missing)
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from backend.api.routes import router
-import uvicorn
+
+
+# Long markdown answers dominate response bodies; orjson encodes them in
+# native code instead of the stdlib's per-character escape loop
+try:
+    import orjson  # noqa: F401
+    DEFAULT_RESPONSE_CLASS = ORJSONResponse
+except ImportError:
+    DEFAULT_RESPONSE_CLASS = JSONResponse
+
+# Frontend dev servers allowed to call the API
+ALLOWED_ORIGINS = ("http://localhost:3000", "http://localhost:3001", "http://localhost:3002", "http://localhost:5173", "http://localhost:5174")
+
+
+class OriginSetCORSMiddleware(CORSMiddleware):
+    """CORS middleware that checks request origins with one set lookup"""
+
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        # Starlette keeps the origin list and scans it on every request
+        self.allow_origins = frozenset(self.allow_origins)
 
 
 # Create FastAPI app
@@ -30,13 +53,14 @@ app = FastAPI(
     description="Pattern Matching Legal Assistant - Manually curated knowledge base from official Indian Acts. No AI models, no hallucinations, 100% verified information.",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=DEFAULT_RESPONSE_CLASS
 )
 
 # Configure CORS - Allow all localhost ports for development
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://localhost:3001", "http://localhost:3002", "http://localhost:5173", "http://localhost:5174"],  # All common dev ports
+    OriginSetCORSMiddleware,
+    allow_origins=ALLOWED_ORIGINS,  # All common dev ports
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -68,14 +92,13 @@ async def startup_event():
     print(">> Mode: Pattern Matching (Manual Curation)")
     print("=" * 80)
     
-    from backend.services.legal_knowledge import LEGAL_KNOWLEDGE
-    import json
-    import os
+    from backend.services.legal_knowledge import LEGAL_KNOWLEDGE, BY_CATEGORY, get_entry_embeddings
+    from backend.services.legal_data import count_legal_data
     
     # Load knowledge base
     try:
         total_entries = len(LEGAL_KNOWLEDGE)
-        categories = list(set([entry["category"] for entry in LEGAL_KNOWLEDGE]))
+        categories = list(BY_CATEGORY)
         total_keywords = sum(len(entry["keywords"]) for entry in LEGAL_KNOWLEDGE)
         
         print(f"[OK] Knowledge base loaded: {total_entries} entries")
@@ -87,14 +110,18 @@ async def startup_event():
     except Exception as e:
         print(f"[ERROR] Could not load knowledge base: {str(e)}")
     
+    # Load the semantic model and entry embeddings before serving, so the
+    # first chat request does not pay for model weights and the bulk encode
+    if get_entry_embeddings() is None:
+        print("[INFO] Semantic similarity unavailable; using pattern matching only")
+    
     # Load scraped legal data for reference (WEB SCRAPING INTEGRATION)
     try:
-        scraped_file = Path(__file__).parent.parent / "data" / "raw" / "legal_data.json"
-        if scraped_file.exists():
-            with open(scraped_file, 'r', encoding='utf-8') as f:
-                scraped_data = json.load(f)
-                print(f"[OK] Web Scraping: {len(scraped_data)} legal documents loaded from kaanoon.com")
-                print("[OK] Scraped data available as reference source")
+        # Only the count is needed here, so records are streamed, not kept
+        scraped_count = count_legal_data()
+        if scraped_count:
+            print(f"[OK] Web Scraping: {scraped_count} legal documents loaded from kaanoon.com")
+            print("[OK] Scraped data available as reference source")
         else:
             print("[INFO] No scraped data found. Knowledge base uses manually curated data.")
     except Exception as e:
@@ -107,11 +134,26 @@ async def startup_event():
 
 
 if __name__ == "__main__":
+    # Only the launcher needs uvicorn; importing the app (workers, reload,
+    # tests) no longer pulls it in at module load
+    import uvicorn
+    
+    # Server worker processes (BACKEND_WORKERS); auto-reload only applies to a
+    # single worker, since uvicorn cannot combine reload with a worker pool
+    workers_setting = os.environ.get("BACKEND_WORKERS", "1")
+    try:
+        workers = int(workers_setting)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        sys.exit(f"[ERROR] BACKEND_WORKERS must be a positive integer, got {workers_setting!r}")
+    
     uvicorn.run(
         "backend.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=workers == 1,
+        workers=workers,
         log_level="info"
     )
 
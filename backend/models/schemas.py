@@ -3,7 +3,7 @@ Pydantic models for request/response validation
 """
 
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Union
 from datetime import datetime
 
 
@@ -81,3 +81,27 @@ class ScrapeResponse(BaseModel):
     pages_scraped: int
     message: str
 
+
+class LegalDocumentMetadata(BaseModel):
+    """Metadata attached to a scraped legal document"""
+    intent: Optional[str] = None
+    patterns: List[str] = Field(default_factory=list)
+    legal_basis: List[str] = Field(default_factory=list)
+    complexity: Optional[str] = None
+    urgency: Optional[str] = None
+    category: Optional[str] = None
+    act: Optional[str] = None
+    section: Optional[str] = None
+    
+    class Config:
+        extra = "allow"
+
+
+class LegalDocument(BaseModel):
+    """Document in the scraped legal corpus (data/raw/legal_data.json)"""
+    url: str
+    title: str
+    content: Union[str, Dict[str, str]] = Field(..., description="Text, or {'ref': sha1} when stored out of line")
+    content_sha256: Optional[str] = Field(None, description="SHA-256 of the content, for change detection")
+    category: Optional[str] = None
+    metadata: LegalDocumentMetadata = Field(default_factory=LegalDocumentMetadata)
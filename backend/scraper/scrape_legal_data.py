@@ -4,13 +4,161 @@ Extracts legal content, case details, and relevant information
 """
 
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from bs4 import BeautifulSoup
+import hashlib
 import json
+import os
+import sys
 import time
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional
 import re
 from pathlib import Path
 
+# Add project root to Python path so backend.* imports work when run as a script
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# Corpus layout helpers shared with the reader side
+from backend.services.legal_data import (
+    category_slug, flatten_record, iter_documents, parse_json, resolve_content,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None  # Fall back to the standard library encoder
+
+try:
+    from blake3 import blake3 as content_hasher
+except ImportError:
+    content_hasher = hashlib.blake2b  # Fall back to the stdlib hash
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # Content blobs stay inline in the JSON export
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None  # Fall back to the hand-written check below
+
+# Parquet columns whose values repeat across documents
+DICTIONARY_COLUMNS = [
+    'url', 'intent', 'patterns', 'legal_basis', 'complexity',
+    'urgency', 'category', 'act', 'section',
+]
+
+# Pages fetched in parallel by default
+FETCH_WORKERS = 4
+
+# Documents per Parquet row group (the unit a single-record read decompresses)
+PARQUET_ROW_GROUP_SIZE = 64
+
+# Output directories already created by this process
+_READY_DIRS: set = set()
+
+
+def ensure_dir(path: Path) -> None:
+    """Create a directory once per process, skipping the syscall on repeats"""
+    if path not in _READY_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _READY_DIRS.add(path)
+
+
+def write_file(path: Path, payload: bytes) -> None:
+    """
+    Write a whole file with raw os.write calls
+    
+    Skips the buffered io layer: a payload that is already one bytes object
+    goes out in a single syscall (looping only on short writes).
+    O_BINARY keeps Windows from translating newline bytes (zstd blobs).
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def fsync_dir(path: Path) -> None:
+    """
+    Flush a directory entry so renames inside it survive a crash
+    Windows cannot open a directory this way (and needs no such flush)
+    """
+    if os.name == 'nt':
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# Key layout shared by every scraped document
+_DOC_TEMPLATE: Dict[str, Any] = {
+    'url': None,
+    'title': None,
+    'content': None,
+    'content_sha256': None,  # Change detection for incremental reindexing
+    'metadata': None,
+    'qa_pairs': (),  # Shared immutable default, encoded as []
+    'scraped_at': None,
+}
+
+
+# Shape every document must have before it is written out
+DOC_SCHEMA: Dict[str, Any] = {
+    '$schema': 'http://json-schema.org/draft-07/schema#',
+    'type': 'object',
+    'required': ['url', 'title', 'content', 'metadata'],
+    'properties': {
+        'url': {'type': 'string'},
+        'title': {'type': 'string'},
+        'content': {'type': 'string'},
+        'content_sha256': {'type': ['string', 'null']},
+        'metadata': {'type': 'object'},
+        'qa_pairs': {'type': 'array'},
+        'scraped_at': {'type': ['string', 'null']},
+    },
+}
+
+
+def _check_doc(doc: Any) -> Any:
+    """Straight-line equivalent of DOC_SCHEMA for when fastjsonschema is missing"""
+    if not isinstance(doc, dict):
+        raise ValueError('data must be object')
+    for field in ('url', 'title', 'content'):
+        if not isinstance(doc.get(field), str):
+            raise ValueError(f'data.{field} must be string')
+    content_sha256 = doc.get('content_sha256')
+    if content_sha256 is not None and not isinstance(content_sha256, str):
+        raise ValueError('data.content_sha256 must be string or null')
+    if not isinstance(doc.get('metadata'), dict):
+        raise ValueError('data.metadata must be object')
+    if not isinstance(doc.get('qa_pairs', ()), (list, tuple)):
+        raise ValueError('data.qa_pairs must be array')
+    scraped_at = doc.get('scraped_at')
+    if scraped_at is not None and not isinstance(scraped_at, str):
+        raise ValueError('data.scraped_at must be string or null')
+    return doc
+
+
+# Compiled once per process; raises a ValueError subclass on bad documents
+validate_doc = fastjsonschema.compile(DOC_SCHEMA) if fastjsonschema is not None else _check_doc
+
 
 class LegalDataScraper:
     """Scraper for legal documents and case information"""
@@ -23,12 +171,13 @@ class LegalDataScraper:
         self.session = requests.Session()
         self.session.headers.update(self.headers)
     
-    def scrape_page(self, url: str) -> Dict:
+    def scrape_page(self, url: str, scraped_at: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Scrape a single legal page
         
         Args:
             url: URL to scrape
+            scraped_at: Shared timestamp for the batch (defaults to now)
             
         Returns:
             Dictionary containing scraped data
@@ -52,21 +201,24 @@ class LegalDataScraper:
             # Extract questions and answers
             qa_pairs = self.extract_qa_pairs(soup)
             
-            data = {
-                'url': url,
-                'title': title,
-                'content': content,
-                'metadata': metadata,
-                'qa_pairs': qa_pairs,
-                'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            return data
+            return self.build_doc(
+                url=url,
+                title=title,
+                content=content,
+                content_sha256=hashlib.sha256(content.encode('utf-8')).hexdigest(),
+                metadata=metadata,
+                qa_pairs=qa_pairs,
+                scraped_at=scraped_at or time.strftime('%Y-%m-%d %H:%M:%S')
+            )
             
         except Exception as e:
             print(f"Error scraping {url}: {str(e)}")
             return None
     
+    def build_doc(self, **fields: Any) -> Dict[str, Any]:
+        """Build a document from the shared template, keeping key order stable"""
+        return {**_DOC_TEMPLATE, **fields}
+    
     def extract_title(self, soup: BeautifulSoup) -> str:
         """Extract page title"""
         # Try multiple selectors
@@ -116,7 +268,7 @@ class LegalDataScraper:
         
         return '\n\n'.join(content_parts)
     
-    def extract_metadata(self, soup: BeautifulSoup) -> Dict:
+    def extract_metadata(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract metadata from the page"""
         metadata = {}
         
@@ -138,7 +290,7 @@ class LegalDataScraper:
         
         return metadata
     
-    def extract_qa_pairs(self, soup: BeautifulSoup) -> List[Dict]:
+    def extract_qa_pairs(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
         """Extract question-answer pairs if available"""
         qa_pairs = []
         
@@ -161,64 +313,444 @@ class LegalDataScraper:
         
         return qa_pairs
     
-    def scrape_multiple_urls(self, urls: List[str]) -> List[Dict]:
+    def scrape_multiple_urls(self, urls: List[str], max_workers: int = FETCH_WORKERS) -> List[Dict[str, Any]]:
         """
-        Scrape multiple URLs
+        Scrape multiple URLs concurrently
         
         Args:
             urls: List of URLs to scrape
+            max_workers: Number of pages fetched in parallel
             
         Returns:
-            List of scraped data dictionaries
+            List of scraped data dictionaries, in the order of urls
         """
-        all_data = []
+        # One timestamp object shared by every document in the batch
+        scraped_at = sys.intern(time.strftime('%Y-%m-%d %H:%M:%S'))
         
-        for url in urls:
-            data = self.scrape_page(url)
-            if data:
-                all_data.append(data)
+        # Past requests' default pool, give every worker its own keep-alive
+        # connection instead of discarding the overflow after each request
+        if max_workers > DEFAULT_POOLSIZE:
+            adapter = HTTPAdapter(pool_maxsize=max_workers)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+        
+        def fetch(url: str) -> Optional[Dict[str, Any]]:
+            data = self.scrape_page(url, scraped_at)
             time.sleep(1)  # Be polite to the server
+            return data
+        
+        # Fetching is network bound, so threads overlap the waits
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch, urls))
+        
+        return [data for data in results if data]
+    
+    def deduplicate(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop documents whose content is an exact duplicate of an earlier one"""
+        seen: set = set()
+        unique: List[Dict[str, Any]] = []
+        
+        for item in data:
+            digest = content_hasher((item.get('content') or '').encode('utf-8')).digest()
+            if digest in seen:
+                continue
+            seen.add(digest)
+            unique.append(item)
         
-        return all_data
+        return unique
     
-    def save_to_json(self, data: List[Dict], filepath: str):
-        """Save scraped data to JSON file"""
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+    def merge_with_existing(self, data: List[Dict[str, Any]], filepath: str) -> List[Dict[str, Any]]:
+        """
+        Merge new documents into an existing JSON export keyed by (title, url)
+        
+        Re-running a scrape replaces earlier copies of the same page instead
+        of appending them again. Replaced keys are logged. The existing
+        export is streamed, so its raw bytes are never held alongside the
+        decoded documents.
+        """
+        path = Path(filepath)
+        if not path.exists():
+            return data
+        
+        # Inline out-of-line bodies, so the rebuilt exports are self-contained
+        content_dir = path.parent / 'content'
+        merged = {(item.get('title'), item.get('url')):
+                  {**item, 'content': resolve_content(item.get('content'), content_dir)}
+                  for item in iter_documents(path)}
+        for item in data:
+            key = (item.get('title'), item.get('url'))
+            if key in merged:
+                print(f"[INFO] Replacing existing document: {key[0]} ({key[1]})")
+            merged[key] = item
+        
+        return list(merged.values())
+    
+    def encode_json(self, item: Dict[str, Any], pretty: bool = False) -> bytes:
+        """Encode a single document as UTF-8 JSON bytes"""
+        if orjson is not None:
+            # orjson emits UTF-8 bytes directly, no per-character escape loop
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(item, option=option)
+        
+        if ujson is not None:
+            return ujson.dumps(item, ensure_ascii=False, escape_forward_slashes=False, indent=2 if pretty else 0).encode('utf-8')
+        
+        kwargs = {'indent': 2} if pretty else {'separators': (',', ':')}
+        return json.dumps(item, ensure_ascii=False, **kwargs).encode('utf-8')
+    
+    def store_content(self, data: Iterable[Dict[str, Any]], content_dir: Path) -> Iterable[Dict[str, Any]]:
+        """
+        Move document content out of line into zstd-compressed blobs
+        
+        Each body is written once to content/<sha1>.zst and the document
+        keeps only {"ref": sha1}. Blobs are content-addressed, so unchanged
+        pages are not rewritten on later runs.
+        """
+        ensure_dir(content_dir)
+        compressor = zstandard.ZstdCompressor(level=10)
+        
+        for item in data:
+            content = item.get('content')
+            if not isinstance(content, str):
+                yield item
+                continue
+            raw = content.encode('utf-8')
+            digest = hashlib.sha1(raw).hexdigest()
+            blob = content_dir / f'{digest}.zst'
+            if not blob.exists():
+                write_file(blob, compressor.compress(raw))
+            yield {**item, 'content': {'ref': digest}}
+    
+    def save_to_json(self, data: Iterable[Dict[str, Any]], filepath: str,
+                     external_content: bool = False) -> None:
+        """
+        Save scraped data to JSON file
+        
+        Documents are streamed to disk one at a time, so memory use does not
+        grow with the corpus. Output is always compact; use make_pretty() for
+        a human-readable copy.
+        
+        A sidecar .idx file maps each metadata intent to the (offset, length)
+        byte ranges of its documents, so readers can seek straight to them.
+        A second sidecar, .index.json, maps each category, act and section
+        to the positions of its documents, with every document's byte range
+        and the size/mtime of the JSON it was built from, so readers can
+        tell whether it still describes the file on disk. A third, .count,
+        holds the number of documents so readers can report it without parsing.
+        
+        With external_content, bodies go to zstd blobs in content/ next to
+        the JSON file and the export keeps only metadata and references.
+        """
+        ensure_dir(Path(filepath).parent)
+        
+        if external_content:
+            if zstandard is None:
+                print("[WARN] zstandard not installed, keeping content inline")
+            else:
+                data = self.store_content(data, Path(filepath).parent / 'content')
+        
+        offsets: Dict[str, List[List[int]]] = {}
+        spans: List[List[int]] = []
+        positions: Dict[str, Dict[str, List[int]]] = {'by_category': {}, 'by_act': {}, 'by_section': {}}
+        
+        # Build next to the target and swap in with os.replace, so a crash
+        # mid-write never leaves a torn legal_data.json behind
+        path = Path(filepath)
+        tmp = path.with_suffix('.json.tmp')
+        count = 0
+        with open(tmp, 'wb') as f:
+            f.write(b'[')
+            for i, item in enumerate(data):
+                count += 1
+                if i:
+                    f.write(b',')
+                payload = self.encode_json(item)
+                span = [f.tell(), len(payload)]
+                spans.append(span)
+                metadata = item.get('metadata') or {}
+                intent = metadata.get('intent')
+                if intent:
+                    offsets.setdefault(intent, []).append(span)
+                for key, value in (('by_category', item.get('category') or metadata.get('category')),
+                                   ('by_act', metadata.get('act')),
+                                   ('by_section', metadata.get('section'))):
+                    if value:
+                        positions[key].setdefault(value, []).append(i)
+                f.write(payload)
+            f.write(b']')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        idx_path = path.with_suffix('.idx')
+        idx_tmp = path.with_suffix('.idx.tmp')
+        write_file(idx_tmp, self.encode_json(offsets))
+        os.replace(idx_tmp, idx_path)
+        
+        # Stamp the index with the export it describes (rename keeps the mtime)
+        stat = path.stat()
+        index = {'generation': {'count': count, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns},
+                 'spans': spans, **positions}
+        index_path = path.with_suffix('.index.json')
+        index_tmp = path.with_suffix('.index.json.tmp')
+        write_file(index_tmp, self.encode_json(index))
+        os.replace(index_tmp, index_path)
+        
+        count_path = path.with_suffix('.count')
+        count_tmp = path.with_suffix('.count.tmp')
+        write_file(count_tmp, str(count).encode('ascii'))
+        os.replace(count_tmp, count_path)
+        
+        # One directory fsync makes all renames durable
+        fsync_dir(path.parent)
         
         print(f"Data saved to {filepath}")
     
-    def save_to_text(self, data: List[Dict], filepath: str):
+    def save_category_shards(self, data: List[Dict[str, Any]], shard_dir: str) -> None:
+        """
+        Save one compact JSON file per category (category_slug() names)
+        
+        Readers that only need one category load its shard instead of
+        parsing the whole corpus.
+        """
+        shards: Dict[str, List[Dict[str, Any]]] = {}
+        for item in data:
+            category = item.get('category') or (item.get('metadata') or {}).get('category')
+            shards.setdefault(category_slug(category), []).append(item)
+        
+        shard_path = Path(shard_dir)
+        ensure_dir(shard_path)
+        for slug, items in shards.items():
+            write_file(shard_path / f'{slug}.json', self.encode_json(items))
+        
+        print(f"{len(shards)} category shard(s) saved to {shard_dir}")
+    
+    def make_pretty(self, json_path: str, pretty_path: str) -> None:
+        """Write an indented copy of a compact JSON export for humans"""
+        data = parse_json(Path(json_path).read_bytes())
+        write_file(Path(pretty_path), self.encode_json(data, pretty=True))
+        
+        print(f"Pretty JSON saved to {pretty_path}")
+    
+    def append_to_ndjson(self, data: List[Dict[str, Any]], filepath: str) -> None:
+        """
+        Append scraped data to an NDJSON log (one document per line)
+        
+        Earlier batches are never re-read or rewritten; the new lines are
+        appended in a single write.
+        """
+        ensure_dir(Path(filepath).parent)
+        
+        if not data:
+            return
+        
+        payload = b'\n'.join(self.encode_json(item) for item in data) + b'\n'
+        with open(filepath, 'ab') as f:
+            f.write(payload)
+        
+        print(f"Appended {len(data)} document(s) to {filepath}")
+    
+    def iter_ndjson(self, filepath: str) -> Iterable[Dict[str, Any]]:
+        """Iterate over the documents in an NDJSON log"""
+        with open(filepath, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield parse_json(line)
+    
+    def compact_ndjson(self, ndjson_path: str, json_path: str,
+                       external_content: bool = False) -> List[Dict[str, Any]]:
+        """
+        Fold the NDJSON log into the exports, then empty the log
+        
+        The log keeps every run since the last compaction, so later copies
+        of a (title, url) replace earlier ones. Documents already in the JSON
+        export (such as the shipped corpus) are kept. Every export is rebuilt
+        from the merged documents before the log is truncated, so a crash in
+        between only means the same batches are merged again next time.
+        Returns the merged documents.
+        """
+        latest: Dict[Any, Dict[str, Any]] = {}
+        if Path(ndjson_path).exists():
+            latest = {(item.get('title'), item.get('url')): item
+                      for item in self.iter_ndjson(ndjson_path)}
+        merged = self.merge_with_existing(list(latest.values()), json_path)
+        
+        self.save_exports(merged, str(Path(json_path).parent), external_content=external_content)
+        
+        if latest:
+            with open(ndjson_path, 'wb') as f:
+                f.flush()
+                os.fsync(f.fileno())
+            print(f"Compacted {len(latest)} logged document(s) from {ndjson_path}")
+        return merged
+    
+    def save_exports(self, data: List[Dict[str, Any]], raw_dir: str = 'data/raw',
+                     external_content: bool = False) -> None:
+        """
+        Write every corpus export from the same documents
+        
+        JSON (with its sidecars), text, Parquet, Arrow IPC and the category
+        shards are always rebuilt together, so no format lags behind another.
+        """
+        raw_path = Path(raw_dir)
+        exports = [
+            # JSON export
+            partial(self.save_to_json, data, str(raw_path / 'legal_data.json'),
+                    external_content=external_content),
+            # Text for easy reading
+            partial(self.save_to_text, data, str(raw_path / 'legal_data.txt')),
+            # Parquet for fast columnar reads
+            partial(self.save_to_parquet, data, str(raw_path / 'legal_data.parquet')),
+            # Arrow IPC for zero-copy memory-mapped reads
+            partial(self.save_to_arrow, data, str(raw_path / 'legal_data.arrow')),
+            # Per-category shards for loading one category at a time
+            partial(self.save_category_shards, data, str(raw_path / 'categories')),
+        ]
+        
+        # The exports are independent files built from the same documents,
+        # so each one gets its own thread (file I/O and Arrow release the GIL)
+        with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+            for future in [executor.submit(export) for export in exports]:
+                future.result()
+    
+    def save_to_text(self, data: List[Dict[str, Any]], filepath: str) -> None:
         """Save scraped data to plain text file for easy reading"""
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            for item in data:
-                f.write(f"{'='*80}\n")
-                f.write(f"TITLE: {item.get('title', 'N/A')}\n")
-                f.write(f"URL: {item.get('url', 'N/A')}\n")
-                f.write(f"{'='*80}\n\n")
-                f.write(f"{item.get('content', '')}\n\n")
-                
-                if item.get('qa_pairs'):
-                    f.write(f"\n{'='*80}\n")
-                    f.write("QUESTIONS & ANSWERS:\n")
-                    f.write(f"{'='*80}\n\n")
-                    for qa in item['qa_pairs']:
-                        f.write(f"Q: {qa['question']}\n")
-                        f.write(f"A: {qa['answer']}\n\n")
-                
-                f.write(f"\n\n")
+        ensure_dir(Path(filepath).parent)
+        
+        # Assemble the whole file, then encode and write it in one call
+        parts: List[str] = []
+        for item in data:
+            parts.append(f"{'='*80}\n")
+            parts.append(f"TITLE: {item.get('title', 'N/A')}\n")
+            parts.append(f"URL: {item.get('url', 'N/A')}\n")
+            parts.append(f"{'='*80}\n\n")
+            parts.append(f"{item.get('content', '')}\n\n")
+            
+            if item.get('qa_pairs'):
+                parts.append(f"\n{'='*80}\n")
+                parts.append("QUESTIONS & ANSWERS:\n")
+                parts.append(f"{'='*80}\n\n")
+                for qa in item['qa_pairs']:
+                    parts.append(f"Q: {qa['question']}\n")
+                    parts.append(f"A: {qa['answer']}\n\n")
+            
+            parts.append("\n\n")
+        
+        write_file(Path(filepath), ''.join(parts).encode('utf-8'))
         
         print(f"Text data saved to {filepath}")
+    
+    def save_to_parquet(self, data: List[Dict[str, Any]], filepath: str) -> None:
+        """
+        Save scraped data as a columnar Parquet file
+        
+        Only the low-cardinality metadata columns are dictionary encoded:
+        each distinct url/intent/act is stored once in a string table and
+        rows hold small integer codes. Unique text columns (title, content)
+        are stored plain, where a dictionary would never pay off.
+        
+        Row groups are kept small so reading one document's content only
+        decompresses the group that holds it. The file is written next to
+        the target and renamed over it, so readers never see a partial file.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            print("[WARN] pyarrow not installed, skipping Parquet export")
+            # Readers prefer this file over the JSON export, so never leave
+            # one from an earlier run behind to serve stale documents
+            stale = Path(filepath)
+            if stale.exists():
+                stale.unlink()
+                print(f"[WARN] Removed stale {stale}")
+            return
+        
+        path = Path(filepath)
+        ensure_dir(path.parent)
+        
+        table = pa.Table.from_pylist([flatten_record(item) for item in data])
+        tmp = path.with_suffix('.parquet.tmp')
+        pq.write_table(table, str(tmp), compression='zstd', use_dictionary=DICTIONARY_COLUMNS,
+                       row_group_size=PARQUET_ROW_GROUP_SIZE)
+        os.replace(tmp, path)
+        fsync_dir(path.parent)
+        
+        print(f"Parquet data saved to {filepath}")
+    
+    def save_to_arrow(self, data: List[Dict[str, Any]], filepath: str) -> None:
+        """
+        Save scraped data as an uncompressed Arrow IPC file
+        
+        Uses the same columns as the Parquet export, with the same types a
+        dictionary-preserving Parquet read yields (list elements included),
+        so readers get one schema from either file. The IPC layout is the
+        in-memory layout, so readers can memory-map it and touch a column
+        (e.g. all titles) without decoding content. Like the Parquet export
+        it is written next to the target and renamed over it.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+        except ImportError:
+            print("[WARN] pyarrow not installed, skipping Arrow export")
+            # Readers prefer this file over the JSON export, so never leave
+            # one from an earlier run behind to serve stale documents
+            stale = Path(filepath)
+            if stale.exists():
+                stale.unlink()
+                print(f"[WARN] Removed stale {stale}")
+            return
+        
+        path = Path(filepath)
+        ensure_dir(path.parent)
+        
+        table = pa.Table.from_pylist([flatten_record(item) for item in data])
+        
+        # Store repeated metadata once per distinct value, as in the Parquet export
+        for name in DICTIONARY_COLUMNS:
+            # An empty export has no columns at all
+            if name not in table.schema.names:
+                continue
+            field_type = table.schema.field(name).type
+            if pa.types.is_string(field_type):
+                column = pc.dictionary_encode(table[name])
+            elif pa.types.is_list(field_type) and pa.types.is_string(field_type.value_type):
+                # Encode the list elements, named 'element' like Parquet's lists
+                values = table[name].combine_chunks()
+                elements = pc.dictionary_encode(values.values)
+                column = pa.ListArray.from_arrays(values.offsets, elements,
+                                                  type=pa.list_(pa.field('element', elements.type)))
+            else:
+                continue
+            table = table.set_column(table.schema.get_field_index(name), name, column)
+        tmp = path.with_suffix('.arrow.tmp')
+        with pa.OSFile(str(tmp), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, path)
+        fsync_dir(path.parent)
+        
+        print(f"Arrow data saved to {filepath}")
 
 
 def main():
     """Main scraping function"""
     scraper = LegalDataScraper()
     
+    # Fold the NDJSON log into the exports without scraping
+    if '--compact' in sys.argv:
+        scraper.compact_ndjson('data/raw/legal_data.ndjson', 'data/raw/legal_data.json',
+                               external_content='--external-content' in sys.argv)
+        return
+    
+    # Write an indented copy of legal_data.json for reading/debugging
+    if '--pretty' in sys.argv:
+        scraper.make_pretty('data/raw/legal_data.json', 'data/raw/legal_data.pretty.json')
+        return
+    
     # Comprehensive list of Indian legal topics
     urls = [
         # Property & Inheritance
@@ -264,14 +796,20 @@ def main():
     scraped_data = scraper.scrape_multiple_urls(all_urls)
     
     if scraped_data:
-        # Save to JSON
-        scraper.save_to_json(scraped_data, 'data/raw/legal_data.json')
+        # Remove exact duplicate documents
+        unique_data = scraper.deduplicate(scraped_data)
+        print(f"Removed {len(scraped_data) - len(unique_data)} duplicate document(s)")
+        scraped_data = unique_data
+        
+        # Reject malformed documents before anything is written
+        for doc in scraped_data:
+            validate_doc(doc)
         
-        # Save to text for easy reading
-        scraper.save_to_text(scraped_data, 'data/raw/legal_data.txt')
+        # Append to the NDJSON log; the exports are only rebuilt by --compact
+        scraper.append_to_ndjson(scraped_data, 'data/raw/legal_data.ndjson')
         
         print(f"\nSuccessfully scraped {len(scraped_data)} page(s)")
-        print(f"Data saved in 'data/raw/' directory")
+        print("Run with --compact to rebuild the exports in 'data/raw/'")
     else:
         print("\n❌ No data was scraped")
 
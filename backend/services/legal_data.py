@@ -0,0 +1,457 @@
+"""
+Legal Data Store
+Read access to the scraped legal corpus in data/raw
+"""
+
+import json
+import mmap
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from pydantic import TypeAdapter
+
+from backend.models.schemas import LegalDocument
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None  # Fall back to the standard library parser
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Location of the persisted corpus
+DATA_DIR = Path(__file__).parent.parent.parent / "data" / "raw"
+LEGAL_DATA_JSON = DATA_DIR / "legal_data.json"
+LEGAL_DATA_PARQUET = DATA_DIR / "legal_data.parquet"
+LEGAL_DATA_ARROW = DATA_DIR / "legal_data.arrow"
+LEGAL_DATA_IDX = DATA_DIR / "legal_data.idx"
+LEGAL_DATA_INDEX = DATA_DIR / "legal_data.index.json"
+LEGAL_DATA_COUNT = DATA_DIR / "legal_data.count"
+CONTENT_DIR = DATA_DIR / "content"
+CATEGORY_DIR = DATA_DIR / "categories"
+
+# Validator for the whole JSON corpus, compiled once per process
+LEGAL_DOCUMENTS = TypeAdapter(List[LegalDocument])
+
+# Short metadata fields that repeat across many records
+INTERNED_FIELDS = ("url", "intent", "complexity", "urgency", "category", "act", "section")
+INTERNED_LIST_FIELDS = ("patterns", "legal_basis")
+
+
+def load_corpus_table(path: Path = LEGAL_DATA_PARQUET, ipc_path: Path = LEGAL_DATA_ARROW):
+    """
+    Load the corpus as an Arrow table
+    Prefers the Arrow IPC export: it is memory-mapped, so columns are
+    zero-copy views of the file and its pages are shared between worker
+    processes; otherwise reads the Parquet file
+    Returns None if pyarrow or both files are not available
+    """
+    if not ipc_path.exists() and not path.exists():
+        return None
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("[WARN] pyarrow not installed, Parquet corpus unavailable")
+        return None
+
+    if ipc_path.exists():
+        with pa.memory_map(str(ipc_path)) as source:
+            table = pa.ipc.open_file(source).read_all()
+    else:
+        # Keep the repeated metadata columns dictionary encoded in memory, so
+        # each distinct value is held once instead of once per row
+        read_dictionary = list(INTERNED_FIELDS) + [f"{field}.list.element" for field in INTERNED_LIST_FIELDS]
+        table = pq.read_table(path, memory_map=True, read_dictionary=read_dictionary)
+
+    # An export of no documents has no columns to filter on; let callers
+    # fall back to the (equally empty) JSON export
+    return table if table.num_columns else None
+
+
+def parse_json(data: bytes):
+    """Parse JSON bytes, preferring orjson, then ujson, then stdlib json"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=256)
+def load_content(ref: str, content_dir: Path = CONTENT_DIR) -> str:
+    """Decompress one out-of-line content blob (content/<sha1>.zst)"""
+    if zstandard is None:
+        raise RuntimeError("zstandard is required to read out-of-line content (pip install zstandard)")
+    blob = (content_dir / f"{ref}.zst").read_bytes()
+    return zstandard.ZstdDecompressor().decompress(blob).decode("utf-8")
+
+
+def resolve_content(content, content_dir: Path = CONTENT_DIR) -> Optional[str]:
+    """
+    Return a record's content text
+    Exports written with --external-content store {"ref": sha1} instead of
+    the body; only records that are actually read get decompressed
+    """
+    if isinstance(content, dict):
+        return load_content(content["ref"], content_dir)
+    return content
+
+
+def flatten_record(item: Dict) -> Dict:
+    """
+    Flatten a nested JSON document into the Parquet column layout
+    Also used by the scraper, so exports and readers share one layout
+    """
+    metadata = item.get("metadata") or {}
+    return {
+        "url": item.get("url"),
+        "title": item.get("title"),
+        "content": item.get("content"),
+        "content_sha256": item.get("content_sha256"),
+        "intent": metadata.get("intent"),
+        "patterns": list(metadata.get("patterns") or []),
+        "legal_basis": list(metadata.get("legal_basis") or []),
+        "complexity": metadata.get("complexity"),
+        "urgency": metadata.get("urgency"),
+        "category": item.get("category") or metadata.get("category"),
+        "act": metadata.get("act"),
+        "section": metadata.get("section"),
+    }
+
+
+def intern_record(record: Dict) -> Dict:
+    """
+    Intern repeated metadata strings so records share one object per value
+    Equality checks on interned values reduce to pointer comparisons
+    """
+    for field in INTERNED_FIELDS:
+        value = record.get(field)
+        if isinstance(value, str):
+            record[field] = sys.intern(value)
+    for field in INTERNED_LIST_FIELDS:
+        values = record.get(field)
+        if values:
+            record[field] = [sys.intern(v) for v in values]
+    return record
+
+
+def intern_document(doc: LegalDocument) -> LegalDocument:
+    """
+    Intern a document's url, category and repeated metadata values
+    Validated models get fresh strings per document; after this, every
+    document citing the same site or act shares one object
+    """
+    doc.url = sys.intern(doc.url)
+    if doc.category is not None:
+        doc.category = sys.intern(doc.category)
+
+    metadata = doc.metadata
+    for field in INTERNED_FIELDS:
+        value = getattr(metadata, field, None)
+        if isinstance(value, str):
+            setattr(metadata, field, sys.intern(value))
+    for field in INTERNED_LIST_FIELDS:
+        values = getattr(metadata, field)
+        if values:
+            setattr(metadata, field, [sys.intern(v) for v in values])
+    return doc
+
+
+def iter_documents(path: Path = LEGAL_DATA_JSON) -> Iterator[Dict]:
+    """
+    Iterate over the documents of a JSON export as stored (nested metadata)
+    Uses the ijson streaming parser when installed, so peak memory stays at
+    one document instead of the whole file; the parser reads straight from
+    a memory map of the file, served by the OS page cache
+    Also used by the scraper to merge new documents into an export
+    """
+    if not path.exists():
+        return
+
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+
+    if ijson is not None:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from ijson.items(mm, "item", use_float=True)
+        return
+
+    # One read of the whole file, parsed from a contiguous bytes buffer
+    yield from parse_json(path.read_bytes())
+
+
+def iter_legal_data(path: Path = LEGAL_DATA_JSON) -> Iterator[Dict]:
+    """
+    Iterate over the JSON corpus one flat record at a time
+    Out-of-line content is left as a reference; see resolve_content()
+    """
+    for item in iter_documents(path):
+        yield intern_record(flatten_record(item))
+
+
+def load_legal_documents(path: Path = LEGAL_DATA_JSON) -> List[LegalDocument]:
+    """
+    Load the JSON corpus as validated LegalDocument models
+    Parsing and validation run together in pydantic's compiled core, so a
+    malformed document fails here rather than at first field access
+    """
+    if not path.exists():
+        return []
+    return [intern_document(doc) for doc in LEGAL_DOCUMENTS.validate_json(path.read_bytes())]
+
+
+def load_legal_data() -> List[Dict]:
+    """
+    Load the legal corpus as a list of flat records
+    Parquet is the canonical source; legal_data.json is the legacy fallback
+    """
+    table = load_corpus_table()
+    if table is not None:
+        return [intern_record(record) for record in table.to_pylist()]
+
+    return list(iter_legal_data())
+
+
+def count_legal_data() -> int:
+    """
+    Count corpus records without holding them all in memory
+    Reads the row count from Parquet metadata, then the .count sidecar
+    written with the JSON export, and only then streams the JSON corpus
+    """
+    if LEGAL_DATA_PARQUET.exists():
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            pq = None
+        if pq is not None:
+            return pq.ParquetFile(LEGAL_DATA_PARQUET).metadata.num_rows
+
+    # The sidecar is written after the export, so an older one is stale
+    if LEGAL_DATA_COUNT.exists() and LEGAL_DATA_JSON.exists():
+        if LEGAL_DATA_COUNT.stat().st_mtime >= LEGAL_DATA_JSON.stat().st_mtime:
+            return int(LEGAL_DATA_COUNT.read_bytes())
+
+    return sum(1 for _ in iter_legal_data())
+
+
+def category_slug(category: Optional[str]) -> str:
+    """
+    File-name slug for a category shard ('Criminal Law - IPC' -> 'criminal_law_ipc')
+    Also used by the scraper to name the shards it writes
+    """
+    slug = re.sub(r"[^a-z0-9]+", "_", (category or "").lower()).strip("_")
+    return slug or "uncategorized"
+
+
+def _load_category_shard(slug: str) -> tuple:
+    path = CATEGORY_DIR / f"{slug}.json"
+    if not path.exists():
+        return ()
+    return _read_category_shard(path, path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=64)
+def _read_category_shard(path: Path, mtime_ns: int) -> tuple:
+    # Keyed by the shard's mtime, so a re-export is read again
+    return tuple(intern_record(flatten_record(item)) for item in parse_json(path.read_bytes()))
+
+
+def load_category_records(category: Optional[str]) -> List[Dict]:
+    """
+    Load the records of a single category from its shard
+    None (or "") selects documents without a category (uncategorized.json)
+    Each shard is parsed on first use only; other categories are never read
+    Falls back to filtering the full corpus when no shards were exported
+    """
+    category = category or None
+    if not CATEGORY_DIR.exists():
+        return get_records_by("category", category)
+    # Distinct names can share a slug, so match the exact category too
+    return [record for record in _load_category_shard(category_slug(category))
+            if (record["category"] or None) == category]
+
+
+def load_categories(categories: Iterable[str], max_workers: int = 8) -> Dict[str, List[Dict]]:
+    """
+    Load several category shards at once, keyed by category
+    Shards are read concurrently in a thread pool, overlapping the file I/O
+    """
+    categories = list(dict.fromkeys(categories))
+    if not categories:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(categories))) as executor:
+        results = executor.map(load_category_records, categories)
+    return dict(zip(categories, results))
+
+
+def read_spans(spans: List[List[int]]) -> List[Dict]:
+    """
+    Read the documents at (offset, length) byte ranges of the JSON export
+    Documents are sliced from a memory map of the file, so pages come from
+    the OS page cache shared by every server worker
+    """
+    if not spans:
+        return []
+    with open(LEGAL_DATA_JSON, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return [intern_record(flatten_record(parse_json(mm[offset:offset + length])))
+                for offset, length in spans]
+
+
+def load_intent_records(intent: str) -> List[Dict]:
+    """
+    Load only the records for one intent using the byte-offset index
+    Reads O(matching documents) instead of parsing the whole corpus
+    """
+    if not LEGAL_DATA_IDX.exists() or not LEGAL_DATA_JSON.exists():
+        records = [record for record in iter_legal_data() if record["intent"] == intent]
+    else:
+        ranges = parse_json(LEGAL_DATA_IDX.read_bytes()).get(intent, [])
+
+        records = read_spans(ranges)
+
+    for record in records:
+        record["content"] = resolve_content(record["content"])
+    return records
+
+
+@lru_cache(maxsize=1)
+def _read_field_index(mtime_ns: int) -> Dict:
+    # Keyed by the file's mtime, so a rewritten index is read again
+    return parse_json(LEGAL_DATA_INDEX.read_bytes())
+
+
+def load_field_index() -> Dict:
+    """
+    Load the by_category/by_act/by_section position index
+    Written next to the JSON export by the scraper; only returned while
+    legal_data.json is still the file it was built from (same size and
+    mtime), otherwise {} so callers fall back to filtering
+    """
+    if not LEGAL_DATA_INDEX.exists() or not LEGAL_DATA_JSON.exists():
+        return {}
+
+    index = _read_field_index(LEGAL_DATA_INDEX.stat().st_mtime_ns)
+    generation = index.get("generation") or {}
+    stat = LEGAL_DATA_JSON.stat()
+    if generation.get("size") != stat.st_size or generation.get("mtime_ns") != stat.st_mtime_ns:
+        return {}
+    return index
+
+
+def get_records_by(field: str, value: Optional[str]) -> List[Dict]:
+    """
+    Get corpus records whose category, act or section equals value
+    (None matches records without one)
+    Uses the position index when it matches legal_data.json, reading only
+    the matching documents from that file; otherwise filters with an Arrow
+    kernel (or a Python scan if there is no Parquet)
+    """
+    index = load_field_index()
+    positions = index.get(f"by_{field}")
+    if positions is not None and value is not None:
+        # Positions refer to legal_data.json, never to the Arrow/Parquet files
+        spans = index["spans"]
+        return read_spans([spans[row] for row in positions.get(value, [])])
+
+    table = load_corpus_table()
+    if table is None:
+        return [record for record in load_legal_data() if record.get(field) == value]
+
+    import pyarrow.compute as pc
+
+    column = table[field]
+    mask = pc.is_null(column) if value is None else pc.fill_null(pc.equal(column, value), False)
+    return [intern_record(record) for record in table.filter(mask).to_pylist()]
+
+
+def get_urgent_records(urgency: str = "immediate") -> List[Dict]:
+    """
+    Get all corpus records with the given urgency
+    Filtering runs as a vectorized Arrow scan, not a Python loop
+    """
+    table = load_corpus_table()
+    if table is None:
+        return []
+
+    import pyarrow.compute as pc
+
+    return table.filter(pc.equal(table["urgency"], urgency)).to_pylist()
+
+
+def search_records(text: str, field: str = "content") -> List[Dict]:
+    """
+    Get corpus records whose field contains text (case-insensitive)
+    Matching runs as one Arrow match_substring kernel over the column
+    """
+    table = load_corpus_table()
+    if table is None:
+        needle = text.lower()
+        records = []
+        for record in iter_legal_data():
+            value = record.get(field)
+            if field == "content":
+                value = resolve_content(value)
+            if value and needle in value.lower():
+                records.append(record)
+        return records
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    # Dictionary-encoded metadata columns are decoded for the string kernel
+    column = table[field]
+    if pa.types.is_dictionary(column.type):
+        column = column.cast(column.type.value_type)
+    mask = pc.fill_null(pc.match_substring(column, text, ignore_case=True), False)
+    return [intern_record(record) for record in table.filter(mask).to_pylist()]
+
+
+def get_record_content(index: int) -> Optional[str]:
+    """
+    Read a single record's content on demand
+    Only the row group holding the record is decompressed, and only its
+    content column; recently read bodies are cached until the Parquet
+    file is rewritten
+    """
+    if not LEGAL_DATA_PARQUET.exists():
+        return None
+    return _read_record_content(index, LEGAL_DATA_PARQUET.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _read_record_content(index: int, mtime_ns: int) -> Optional[str]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("[WARN] pyarrow not installed, Parquet corpus unavailable")
+        return None
+
+    parquet_file = pq.ParquetFile(LEGAL_DATA_PARQUET, memory_map=True)
+    if not 0 <= index < parquet_file.metadata.num_rows:
+        return None
+
+    for group in range(parquet_file.num_row_groups):
+        group_rows = parquet_file.metadata.row_group(group).num_rows
+        if index < group_rows:
+            column = parquet_file.read_row_group(group, columns=["content"]).column("content")
+            return column[index].as_py()
+        index -= group_rows
+    return None
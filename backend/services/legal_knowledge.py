@@ -17,12 +17,29 @@ COMPETITION-READY: All NLP objectives fully implemented!
 
 from difflib import SequenceMatcher
 from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+import os
 import re
+import tempfile
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Fall back to per-pattern substring checks
 
 # ============================================================================
 # NLP ENHANCEMENT: Sentence Embeddings for Semantic Similarity
 # ============================================================================
 
+# Sentence transformer used for semantic similarity
+SEMANTIC_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+# Entry embeddings persisted between runs, one row per model + entry text hash
+EMBEDDING_CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "cache"
+EMBEDDING_CACHE_PATH = EMBEDDING_CACHE_DIR / "entry_embeddings.npz"
+
 # Global model variable (lazy loading)
 _semantic_model = None
 
@@ -36,7 +53,7 @@ def get_semantic_model():
         try:
             from sentence_transformers import SentenceTransformer
             print("[INFO] Loading semantic model for NLP enhancement...")
-            _semantic_model = SentenceTransformer('all-MiniLM-L6-v2')
+            _semantic_model = SentenceTransformer(SEMANTIC_MODEL_NAME)
             print("[OK] Semantic similarity enabled")
         except Exception as e:
             print(f"[WARN] Semantic model not available: {e}")
@@ -44,34 +61,151 @@ def get_semantic_model():
     return _semantic_model if _semantic_model else None
 
 
-def calculate_semantic_similarity(query, entry_text):
+# Embeddings for every knowledge base entry (lazy loading, built in one batch)
+_entry_embeddings = None
+
+# Entries per forward pass when encoding the knowledge base
+EMBEDDING_BATCH_SIZE = 64
+
+
+def embedding_key(sample):
+    """Cache key for one entry sample (changes with the text or the model)"""
+    return hashlib.sha256(f"{SEMANTIC_MODEL_NAME}\0{sample}".encode('utf-8')).hexdigest()
+
+
+def load_embedding_cache():
     """
-    Calculate semantic similarity between query and knowledge base entry
-    Uses sentence embeddings (BERT-based) for deep semantic understanding
-    Returns: similarity score (0.0 to 1.0)
+    Load persisted embeddings as {key: unit-length row}
+    An unreadable or truncated cache counts as empty, so every entry is
+    re-encoded and the cache is rewritten
+    """
+    if not EMBEDDING_CACHE_PATH.exists():
+        return {}
+    
+    import numpy as np
+    try:
+        with np.load(EMBEDDING_CACHE_PATH) as data:
+            return dict(zip(data["keys"].tolist(), data["matrix"]))
+    except Exception as e:
+        print(f"[WARN] Ignoring unreadable embedding cache: {e}")
+        return {}
+
+
+def save_embedding_cache(keys, matrix):
+    """
+    Persist embeddings atomically (write then rename, never a partial file)
+    Each process writes its own temp file, so concurrent workers never
+    interleave writes into one
+    """
+    import numpy as np
+    tmp_path = None
+    try:
+        EMBEDDING_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=EMBEDDING_CACHE_DIR, suffix='.tmp', delete=False) as f:
+            tmp_path = f.name
+            np.savez(f, keys=np.array(keys), matrix=matrix)
+        os.replace(tmp_path, EMBEDDING_CACHE_PATH)
+    except OSError as e:
+        print(f"[WARN] Could not cache embeddings: {e}")
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def get_entry_embeddings():
+    """
+    Encode all knowledge base entries in a single batched model call
+    Built once on first use and reused for every query
+    
+    Incremental: rows are persisted in data/cache keyed by a hash of each
+    entry's text, so a later run only encodes entries that were added or
+    edited, and drops rows for entries that were removed
+    Returns an L2-normalized (entries x dim) matrix
+    """
+    global _entry_embeddings
+    if _entry_embeddings is None:
+        model = get_semantic_model()
+        if model is None:
+            return None
+        try:
+            import numpy as np
+            
+            # Use first 500 characters of each entry for efficiency
+            samples = [entry["response"][:500] for entry in LEGAL_KNOWLEDGE]
+            keys = [embedding_key(sample) for sample in samples]
+            cached = load_embedding_cache()
+            
+            # Rows of another width were written by a different model build;
+            # drop them so those entries are re-encoded with this one
+            dim = model.get_sentence_embedding_dimension()
+            if dim is not None:
+                cached = {key: row for key, row in cached.items() if row.shape == (dim,)}
+            
+            # Identical samples share a key, so each distinct text is encoded once
+            missing = {key: sample for key, sample in zip(keys, samples) if key not in cached}
+            
+            if missing:
+                embeddings = model.encode(list(missing.values()), batch_size=EMBEDDING_BATCH_SIZE, convert_to_tensor=False)
+                
+                # Unit-length rows, so cosine similarity is a dot product
+                matrix = np.asarray(embeddings, dtype=np.float32)
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                norms[norms == 0] = 1.0
+                for key, row in zip(missing, matrix / norms):
+                    cached[key] = row
+                print(f"[OK] Encoded {len(missing)} new or changed knowledge base entries")
+            
+            # Build the index once: one (entries x dim) float32 matrix
+            _entry_embeddings = np.stack([cached[key] for key in keys])
+            print(f"[OK] Knowledge base embeddings ready: {len(keys)} entries")
+            
+            # Rewrite the cache when entries were added, edited or removed
+            if missing or len(cached) != len(set(keys)):
+                save_embedding_cache(keys, _entry_embeddings)
+        except Exception as e:
+            print(f"[WARN] Knowledge base encoding failed: {e}")
+            _entry_embeddings = False  # Mark as unavailable
+    return _entry_embeddings if _entry_embeddings is not False else None
+
+
+def encode_query(query):
+    """
+    Encode a user query once for comparison against every entry
+    Returns an L2-normalized vector, or None if semantic matching is unavailable
     """
     model = get_semantic_model()
-    if model is None:
-        return 0.0  # Fallback if model not available
+    if model is None or get_entry_embeddings() is None:
+        return None
     
     try:
-        # Use first 500 characters of entry for efficiency
-        entry_sample = entry_text[:500]
-        
-        # Encode both texts
-        query_embedding = model.encode(query, convert_to_tensor=False)
-        entry_embedding = model.encode(entry_sample, convert_to_tensor=False)
-        
-        # Calculate cosine similarity
         import numpy as np
-        similarity = np.dot(query_embedding, entry_embedding) / (
-            np.linalg.norm(query_embedding) * np.linalg.norm(entry_embedding)
-        )
-        
-        return float(similarity)
+        query_embedding = np.asarray(model.encode(query, convert_to_tensor=False), dtype=np.float32)
+        norm = np.linalg.norm(query_embedding)
+        return query_embedding / norm if norm else query_embedding
+    except Exception as e:
+        print(f"[WARN] Query encoding failed: {e}")
+        return None
+
+
+def calculate_semantic_similarities(query_embedding):
+    """
+    Calculate semantic similarity between the query and every knowledge base entry
+    Uses sentence embeddings (BERT-based) for deep semantic understanding
+    One matrix-vector product over the precomputed entry matrix scores all
+    entries at once instead of one Python-level dot product per entry
+    Returns: list of similarity scores (0.0 to 1.0), one per entry
+    """
+    if query_embedding is None:
+        return [0.0] * len(LEGAL_KNOWLEDGE)  # Fallback if model not available
+    
+    try:
+        # Cosine similarity (rows and query are already unit length)
+        return (get_entry_embeddings() @ query_embedding).tolist()
     except Exception as e:
         print(f"[WARN] Semantic similarity calculation failed: {e}")
-        return 0.0
+        return [0.0] * len(LEGAL_KNOWLEDGE)
 
 
 # ============================================================================
@@ -193,6 +327,56 @@ def detect_language(text):
     return 'en'
 
 
+# Common Hindi legal terms translation
+HINDI_TO_ENGLISH = {
+    'तलाक': 'divorce',
+    'विवाह': 'marriage',
+    'शादी': 'marriage',
+    'संपत्ति': 'property',
+    'जमीन': 'land',
+    'घर': 'house',
+    'पुलिस': 'police',
+    'अधिकार': 'rights',
+    'कानून': 'law',
+    'न्यायालय': 'court',
+    'वकील': 'lawyer',
+    'मुकदमा': 'case',
+    'अपराध': 'crime',
+    'गिरफ्तारी': 'arrest',
+    'जमानत': 'bail',
+    'धारा': 'section',
+    'अनुच्छेद': 'article',
+    'संविधान': 'constitution',
+    'मौलिक': 'fundamental',
+    'उपभोक्ता': 'consumer',
+    'शिकायत': 'complaint',
+    'नौकरी': 'employment job',
+    'वेतन': 'salary',
+    'परिवार': 'family',
+    'बच्चे': 'children child',
+    'माता': 'mother',
+    'पिता': 'father',
+    'पत्नी': 'wife',
+    'पति': 'husband',
+    'विरासत': 'inheritance',
+    'उत्तराधिकार': 'succession',
+    'रजिस्ट्रेशन': 'registration',
+    'दस्तावेज': 'document',
+    'प्रक्रिया': 'procedure process',
+    'समय': 'time',
+    'खर्च': 'cost fee',
+    'कैसे': 'how to',
+    'क्या': 'what',
+    'कब': 'when',
+    'कहाँ': 'where',
+    'क्यों': 'why',
+    'मदद': 'help',
+    'जानकारी': 'information',
+    'सलाह': 'advice',
+    'गाइड': 'guide',
+}
+
+
 def translate_to_english(text, source_lang='hi'):
     """
     Translate Hindi query to English for processing
@@ -202,55 +386,6 @@ def translate_to_english(text, source_lang='hi'):
     if source_lang != 'hi':
         return text
     
-    # Common Hindi legal terms translation
-    hindi_to_english = {
-        'तलाक': 'divorce',
-        'विवाह': 'marriage',
-        'शादी': 'marriage',
-        'संपत्ति': 'property',
-        'जमीन': 'land',
-        'घर': 'house',
-        'पुलिस': 'police',
-        'अधिकार': 'rights',
-        'कानून': 'law',
-        'न्यायालय': 'court',
-        'वकील': 'lawyer',
-        'मुकदमा': 'case',
-        'अपराध': 'crime',
-        'गिरफ्तारी': 'arrest',
-        'जमानत': 'bail',
-        'धारा': 'section',
-        'अनुच्छेद': 'article',
-        'संविधान': 'constitution',
-        'मौलिक': 'fundamental',
-        'उपभोक्ता': 'consumer',
-        'शिकायत': 'complaint',
-        'नौकरी': 'employment job',
-        'वेतन': 'salary',
-        'परिवार': 'family',
-        'बच्चे': 'children child',
-        'माता': 'mother',
-        'पिता': 'father',
-        'पत्नी': 'wife',
-        'पति': 'husband',
-        'विरासत': 'inheritance',
-        'उत्तराधिकार': 'succession',
-        'रजिस्ट्रेशन': 'registration',
-        'दस्तावेज': 'document',
-        'प्रक्रिया': 'procedure process',
-        'समय': 'time',
-        'खर्च': 'cost fee',
-        'कैसे': 'how to',
-        'क्या': 'what',
-        'कब': 'when',
-        'कहाँ': 'where',
-        'क्यों': 'why',
-        'मदद': 'help',
-        'जानकारी': 'information',
-        'सलाह': 'advice',
-        'गाइड': 'guide',
-    }
-    
     # Attempt word-level translation
     translated_words = []
     words = text.split()
@@ -258,7 +393,7 @@ def translate_to_english(text, source_lang='hi'):
     for word in words:
         # Remove punctuation
         clean_word = word.strip('।,.?!;:')
-        translated = hindi_to_english.get(clean_word, word)
+        translated = HINDI_TO_ENGLISH.get(clean_word, word)
         translated_words.append(translated)
     
     translated_text = ' '.join(translated_words)
@@ -7240,6 +7375,31 @@ I'm here to help you understand your legal rights and procedures under Indian la
     }
 ]
 
+# Category -> entries index, built once so lookups by category are O(1)
+# A plain dict, so looking up an unknown category never inserts an empty one
+BY_CATEGORY = {}
+for _entry in LEGAL_KNOWLEDGE:
+    BY_CATEGORY.setdefault(_entry["category"], []).append(_entry)
+del _entry
+
+
+class EntryProfile:
+    """
+    Lowercased views of one entry's category and keywords, built once
+    Slots keep the per-entry objects small; the scorer reads these on
+    every query instead of re-lowering and re-joining the keywords
+    """
+    __slots__ = ('category_lower', 'category_words', 'keywords', 'keywords_lower')
+    
+    def __init__(self, entry):
+        self.category_lower = entry["category"].lower()
+        self.category_words = tuple(self.category_lower.split())
+        self.keywords = tuple(keyword.lower() for keyword in entry["keywords"])
+        self.keywords_lower = ' '.join(entry["keywords"]).lower()
+
+# One profile per entry, aligned with LEGAL_KNOWLEDGE
+ENTRY_PROFILES = [EntryProfile(entry) for entry in LEGAL_KNOWLEDGE]
+
 
 # ===== ADVANCED AI ALGORITHMS FOR INTELLIGENT MATCHING =====
 
@@ -7291,14 +7451,28 @@ def expand_query_with_synonyms(query):
     
     return list(expanded_terms)
 
+@lru_cache(maxsize=8192)
 def fuzzy_match_score(str1, str2):
     """
     Calculate fuzzy matching score between two strings
     Handles typos and similar words
     Returns: similarity score between 0 and 1
+    (cached: the same word/keyword pairs recur across entries and queries)
     """
     return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
 
+# Common typo corrections for legal terms
+TYPO_CORRECTIONS = {
+    "divorse": "divorce",
+    "devorce": "divorce",
+    "propery": "property",
+    "registraton": "registration",
+    "complant": "complaint",
+    "complain": "complaint",
+    "poilce": "police",
+    "polce": "police",
+}
+
 def preprocess_query(query):
     """
     Advanced query preprocessing with spell correction and normalization
@@ -7313,35 +7487,33 @@ def preprocess_query(query):
     query = ' '.join(query.split())
     
     # Common typo corrections for legal terms
-    typo_corrections = {
-        "divorse": "divorce",
-        "devorce": "divorce",
-        "propery": "property",
-        "registraton": "registration",
-        "complant": "complaint",
-        "complain": "complaint",
-        "poilce": "police",
-        "polce": "police",
-    }
-    
-    for typo, correct in typo_corrections.items():
+    for typo, correct in TYPO_CORRECTIONS.items():
         query = query.replace(typo, correct)
     
     return query
 
+@lru_cache(maxsize=None)
+def normalize_keyword(keyword):
+    """
+    Lowercase and split a knowledge base keyword (cached per keyword)
+    Keywords are fixed, so this runs once per keyword instead of per query
+    """
+    keyword_lower = keyword.lower()
+    return keyword_lower, keyword_lower.split()
+
 def calculate_tfidf_score(query_words, keywords):
     """
     Advanced TF-IDF inspired scoring for better relevance
     """
     score = 0
     query_counter = Counter(query_words)
+    query_text = ' '.join(query_words)
     
     for keyword in keywords:
-        keyword_lower = keyword.lower()
-        keyword_words = keyword_lower.split()
+        keyword_lower, keyword_words = normalize_keyword(keyword)
         
         # Exact keyword match (highest weight)
-        if keyword_lower in ' '.join(query_words):
+        if keyword_lower in query_text:
             score += 15
         
         # Individual word matches
@@ -7359,6 +7531,159 @@ def calculate_tfidf_score(query_words, keywords):
     
     return score
 
+# COMPREHENSIVE context patterns for ALL legal categories
+# (built once at import, not on every extract_query_context call)
+QUERY_CONTEXT_PATTERNS = {
+    # ============ CRIMINAL LAW ============
+    'fir_filing': ['file fir', 'lodge fir', 'register fir', 'fir process', 'how to file complaint', 'lodge complaint', 'police station', 'report crime', 'complaint against', 'register case', 'file case', 'report to police', 'fir copy', 'zero fir', 'online fir', 'fir not registered', 'police not registering fir', 'complaint procedure', 'police complaint', 'criminal complaint', 'fir against', 'register criminal case', 'complaint in police station', 'nc complaint', 'crime report', 'police report', 'first information report', 'fir format', 'fir sample', 'fir registration', 'how to lodge fir'],
+    'bail': ['bail', 'release', 'custody', 'grant bail', 'bail application', 'anticipatory bail', 'get bail', 'apply for bail', 'bail conditions', 'bail amount', 'bail rejected', 'bail hearing', 'bail bond', 'bail order', 'how to get bail', 'bail procedure', 'bail in non bailable offence', 'bail in bailable offence', 'bail plea', 'bail petition', 'surety for bail', 'regular bail', 'interim bail', 'bail cancellation', 'bail grounds'],
+    'arrest': ['arrested', 'arrest procedure', 'custody', 'detention', 'police custody', 'taken into custody', 'under arrest', 'arrested by police', 'arrest warrant', 'wrongful arrest', 'illegal arrest', 'arrest without warrant', 'rights after arrest', 'arrest memo', 'judicial custody', 'remand', 'police remand', 'rights when arrested', 'what to do if arrested', 'arrest rights', 'unlawful arrest'],
+    
+    # ============ CONSTITUTIONAL RIGHTS & CONSTITUTION ============
+    'rights_harassment': ['harass', 'threaten', 'abuse', 'wrongly', 'false', 'illegal', 'my rights', 'protect me', 'fundamental rights', 'violated', 'rights violated', 'harassment by authority', 'police harassment', 'government harassment', 'official harassment', 'constitutional rights', 'human rights', 'civil rights', 'liberty', 'freedom', 'rights protection', 'violation of rights', 'abuse of power', 'misuse of authority', 'wrongful detention', 'illegal detention'],
+    'rights_enforcement': ['enforce rights', 'writ', 'petition', 'supreme court', 'high court', 'article 21', 'article 32', 'writ petition', 'habeas corpus', 'mandamus', 'certiorari', 'prohibition', 'quo warranto', 'file writ', 'writ jurisdiction', 'constitutional petition', 'pil', 'public interest litigation', 'fundamental rights petition', 'writ hearing', 'writ procedure'],
+    'constitution_general': ['constitution', 'indian constitution', 'constitutional law', 'constitutional provisions', 'part iii', 'part iv', 'preamble', 'basic structure', 'kesavananda bharati', 'constitutional amendments', 'constitutional validity', 'constituent assembly'],
+    'fundamental_rights': ['fundamental rights', 'article 14', 'article 15', 'article 16', 'article 19', 'article 20', 'article 21', 'article 21a', 'article 22', 'article 23', 'article 24', 'article 25', 'article 26', 'article 29', 'article 30', 'right to equality', 'right to freedom', 'right to life', 'right to education', 'freedom of speech', 'freedom of religion', 'cultural rights', 'right against exploitation', 'articles 12-35'],
+    'directive_principles': ['directive principles', 'dpsp', 'article 36', 'article 37', 'article 38', 'article 39', 'article 40', 'article 41', 'article 42', 'article 43', 'article 44', 'article 45', 'article 46', 'article 47', 'article 48', 'article 48a', 'article 49', 'article 50', 'article 51', 'uniform civil code', 'state policy', 'non-justiciable', 'gandhian principles', 'socialistic principles', 'part iv constitution', 'welfare state', 'panchayati raj', 'free legal aid', 'environment protection', 'living wage', 'article 39a'],
+    'landmark_cases': ['landmark case', 'supreme court case', 'landmark judgment', 'famous case', 'important case', 'maneka gandhi', 'kesavananda bharati', 'minerva mills', 'golaknath', 'indra sawhney', 'mandal commission', 'shah bano', 'vishaka', 'puttaswamy', 'privacy case', 'section 377', 'navtej singh johar', 'shreya singhal', 'olga tellis', 'mc mehta', 'basic structure doctrine', 'reservation case', 'triple talaq', 'sabarimala', 'aadhaar case', 'judicial review', 'constitutional case law'],
+    'emergency_provisions': ['emergency', 'national emergency', 'president rule', 'article 352', 'article 356', 'article 360', 'financial emergency', 'suspension of rights', 'emergency provisions', 'state emergency', 'constitutional emergency'],
+    'writs_detailed': ['writ of habeas corpus', 'writ of mandamus', 'writ of certiorari', 'writ of prohibition', 'writ of quo warranto', 'article 32 petition', 'article 226 petition', 'constitutional remedies', 'writ types', 'five writs', 'writ jurisdiction', 'file writ petition', 'supreme court writ', 'high court writ'],
+    
+    # ============ FAMILY LAW ============
+    'divorce': ['divorce', 'divorse', 'separation', 'breakup', 'end marriage', 'dissolve marriage', 'divorce case', 'divorce lawyer', 'divorce petition', 'divorce application', 'judicial separation', 'nullity of marriage', 'void marriage', 'annulment'],
+    'divorce_mutual': ['mutual consent', 'both want', 'both agree', 'both interested', 'both willing', 'amicable', 'mutual divorce', 'agreed divorce', 'uncontested divorce', 'we both want divorce', 'husband wife agree', 'peaceful divorce', 'no contest divorce', 'consent divorce', 'amicable separation', 'joint petition'],
+    'divorce_grounds': ['grounds', 'reason for divorce', 'cause for divorce', 'basis for divorce', 'grounds for divorce', 'divorce reasons', 'valid grounds', 'adultery', 'cruelty', 'desertion', 'mental cruelty', 'physical cruelty', 'grounds under hindu marriage act', 'section 13 grounds'],
+    'divorce_procedure': ['divorce process', 'divorce procedure', 'how to divorce', 'divorce steps', 'file divorce', 'divorce filing', 'how to file divorce', 'divorce court', 'family court', 'divorce petition format', 'divorce documents', 'divorce timeline', 'how long divorce takes'],
+    'maintenance': ['alimony', 'maintenance', 'support', 'financial support', 'monthly payment', 'wife maintenance', 'interim maintenance', 'permanent alimony', 'maintenance amount', 'how much alimony', 'section 125 crpc', 'maintenance case', 'maintenance order', 'spousal support', 'maintenance for wife', 'maintenance for child', 'maintenance claim'],
+    'custody': ['child custody', 'custody', 'visitation', 'children', 'parenting', 'custody battle', 'child custody case', 'custody rights', 'visitation rights', 'who gets child', 'custody of children', 'guardianship', 'minor custody', 'custody order', 'joint custody', 'sole custody', 'custody after divorce'],
+    
+    # ============ PROPERTY LAW ============
+    'property_registration': ['register property', 'property registration', 'house registration', 'deed registration', 'registry', 'how to register', 'registration process', 'register deed', 'property documents', 'stamp duty', 'register house', 'register land', 'sub registrar', 'registration fee', 'mutation', 'registry office'],
+    'property_inheritance': ['inheritance', 'succession', 'after death', 'parents demise', 'ancestral property', 'legal heir', 'will', 'succession certificate', 'father died', 'mother died', 'parent death', 'inherit property', 'property after death', 'will property', 'intestate succession', 'legal heir certificate', 'partition', 'ancestral land', 'family property', 'share in property'],
+    'property_dispute': ['property dispute', 'land dispute', 'ownership', 'claim', 'encroachment', 'illegally occupied', 'illegal occupation', 'someone occupied', 'occupied my land', 'get back my land', 'get back my property', 'trespassing', 'unauthorized possession', 'forceful possession', 'kabza', 'possession dispute', 'boundary dispute', 'title dispute', 'fake documents', 'forged papers', 'someone took my land', 'neighbor encroached', 'trespasser on property', 'squatters', 'illegal construction on my land', 'someone built on my land', 'remove illegal occupants', 'reclaim property', 'possession back', 'land grabbing', 'illegal settler', 'encroachment removal', 'boundary wall dispute', 'land grabber', 'property theft', 'fraudulent sale', 'property fraud', 'forged sale deed', 'fake registry', 'title suit', 'injunction', 'stay order', 'civil suit for possession'],
+    'property_transfer': ['transfer property', 'gift deed', 'sale deed', 'mutation', 'property transfer deed', 'transfer ownership', 'property sale', 'sell property', 'buy property', 'transfer land', 'change ownership', 'property buyer', 'property seller'],
+    
+    # ============ EMPLOYMENT LAW ============
+    'employment_termination': ['fired', 'termination', 'dismissed', 'removal', 'lost job', 'wrongful termination', 'terminated', 'sacked', 'removed from job', 'job loss', 'unfair dismissal', 'illegal termination', 'termination without notice', 'termination letter', 'wrongful dismissal', 'illegal firing', 'unfair firing', 'termination compensation', 'termination notice', 'retrenchment', 'layoff', 'forced resignation', 'constructive dismissal', 'termination without reason', 'arbitrary termination', 'termination during probation', 'termination appeal', 'reinstatement', 'job back', 'termination illegal'],
+    'employment_salary': ['salary', 'wages', 'payment', 'dues', 'unpaid', 'compensation', 'salary not paid', 'pending salary', 'wage not received', 'payment pending', 'salary delay', 'withheld salary', 'salary not received', 'pending dues', 'salary dispute', 'wage dispute', 'non payment of salary', 'salary claim', 'salary recovery', 'salary arrears', 'unpaid wages', 'wage theft', 'salary withheld', 'employer not paying', 'salary complaint', 'labour commissioner salary', 'salary legal action', 'recover salary', 'salary court case'],
+    'employment_rights': ['employee rights', 'labour rights', 'working conditions', 'overtime', 'work hours', 'workplace rights', 'exploitation', 'labour law', 'employee benefits', 'working hours violation', 'overtime pay', 'workplace harassment', 'discrimination at work', 'employee exploitation', 'forced work', 'labour rights violation', 'workplace safety', 'employee grievance', 'labour complaint'],
+    'employment_resignation': ['resign', 'resignation', 'notice period', 'quit job', 'leave job', 'want to resign', 'how to resign', 'leaving job', 'resignation letter', 'resignation acceptance', 'resignation withdrawal', 'notice period buyout', 'resignation without notice', 'relieving letter', 'experience letter', 'full and final settlement', 'resignation process', 'resignation rules', 'immediate resignation', 'resignation law'],
+    'pf_gratuity': ['pf', 'provident fund', 'gratuity', 'epf', 'pension', 'pf withdrawal', 'gratuity claim', 'epf transfer', 'retirement benefits', 'pf balance', 'pf claim', 'pf not deposited', 'employer not depositing pf', 'epf withdrawal', 'pf transfer online', 'gratuity eligibility', 'gratuity calculation', 'gratuity payment', 'pf claim rejection', 'eps pension', 'pf passbook', 'uan', 'pf account', 'gratuity not paid', 'pf settlement'],
+    
+    # ============ CONSUMER LAW ============
+    'consumer_defective': ['defective', 'faulty', 'broken', 'damaged', 'poor quality', 'defective product', 'not working', 'malfunctioning', 'product issue', 'manufacturing defect', 'product defect', 'faulty goods', 'broken product', 'damaged goods', 'product failure', 'defective item', 'product not working', 'faulty product', 'quality issue', 'substandard product', 'inferior quality', 'product complaint'],
+    'consumer_refund': ['refund', 'return', 'money back', 'reimbursement', 'want refund', 'get refund', 'return product', 'exchange', 'refund policy', 'return policy', 'refund request', 'refund denied', 'refund procedure', 'how to get refund', 'refund not given', 'seller not refunding', 'shop not refunding', 'refund claim', 'refund complaint', 'exchange product', 'product return'],
+    'consumer_complaint': ['consumer complaint', 'consumer forum', 'file complaint', 'consumer court', 'complain against shop', 'complaint against seller', 'how to complain', 'consumer grievance', 'consumer redressal', 'consumer protection', 'consumer case', 'consumer court complaint', 'online consumer complaint', 'consumer helpline', 'consumer complaint format', 'consumer complaint procedure', 'district consumer forum', 'state consumer commission', 'national consumer commission'],
+    'consumer_service': ['service deficiency', 'poor service', 'bad service', 'service problem', 'service not provided', 'delayed service', 'deficient service', 'service complaint', 'service issue', 'unsatisfactory service', 'service failure', 'service quality', 'service dispute', 'service provider complaint'],
+    'consumer_warranty': ['warranty', 'guarantee', 'replacement', 'warranty claim', 'under warranty', 'warranty expired', 'warranty period', 'warranty card', 'warranty rejection', 'warranty not honored', 'guarantee period', 'manufacturer warranty', 'warranty service', 'warranty claim rejected', 'replacement under warranty'],
+    
+    # ============ EDUCATION LAW ============
+    'education_corporal': ['beat', 'beating', 'hit', 'slap', 'corporal', 'physical punishment', 'teacher beats', 'teacher hit', 'corporal punishment', 'teacher beating student', 'physical punishment by teacher', 'teacher slapping', 'teacher violence', 'punishment by teacher', 'teacher abuse', 'student beaten', 'teacher assault', 'school punishment', 'teacher harassment', 'severe punishment', 'teacher misconduct', 'physical abuse by teacher'],
+    'education_admission': ['admission', 'rte', 'school admission', 'college admission', 'enrollment', 'admission process', 'admission denied', 'admission criteria', 'admission quota', 'school enrollment', 'admission fee', 'admission procedure', 'right to education admission', 'rte admission', 'free admission', 'admission age', 'admission documents', 'admission appeal', 'admission seat', 'nursery admission', 'kg admission', 'class 1 admission'],
+    'education_fee': ['school fee', 'college fee', 'tuition', 'fee structure', 'donation', 'school fees high', 'fee hike', 'tuition fee', 'education fee', 'fee complaint', 'excessive fee', 'fee refund', 'fee issue', 'capitation fee', 'donation for admission', 'illegal fee', 'fee not affordable', 'fee waiver', 'fee concession', 'school charging extra', 'hidden charges'],
+    'education_rights': ['right to education', 'free education', 'education rights', 'rte act', 'education for all', 'compulsory education', 'free and compulsory education', 'child education rights', 'education law', 'school rights', 'student rights', 'education violation'],
+    
+    # ============ CYBER LAW ============
+    'cyber_fraud': ['online fraud', 'cyber fraud', 'internet fraud', 'phishing', 'scam', 'hacking', 'online scam', 'upi fraud', 'payment fraud', 'account hacked', 'money stolen online', 'fake website', 'fraudulent transaction', 'online payment fraud', 'credit card fraud', 'debit card fraud', 'netbanking fraud', 'wallet fraud', 'paytm fraud', 'gpay fraud', 'phonepe fraud', 'fraud email', 'fraud sms', 'otp fraud', 'vishing', 'smishing', 'fake app', 'scam website', 'lottery scam', 'job scam online', 'investment scam', 'dating scam', 'facebook scam', 'whatsapp scam', 'instagram scam', 'olx fraud', 'amazon fraud', 'flipkart fraud'],
+    'cyber_harassment': ['cyber harassment', 'online harassment', 'cyberbullying', 'trolling', 'online abuse', 'social media harassment', 'online threats', 'morphed photos', 'defamation online', 'cyberstalking', 'online stalking', 'social media abuse', 'fake profile', 'impersonation online', 'reputation damage', 'online blackmail', 'revenge porn', 'intimate images leaked', 'cyber stalking', 'online intimidation', 'harassment on facebook', 'harassment on instagram', 'harassment on twitter', 'whatsapp harassment', 'email harassment'],
+    'cyber_complaint': ['cyber complaint', 'cyber crime', 'report online', 'cyber cell', 'report cyber crime', 'complaint to cyber police', 'how to report online fraud', 'cyber crime complaint', 'online fir cyber', 'cybercrime portal', 'report phishing', 'report hacking', 'national cyber crime portal', 'cyber complaint online', 'cyber police complaint', 'cyber helpline', 'cybercrime reporting'],
+    'cyber_privacy': ['data privacy', 'data theft', 'personal information', 'privacy violation', 'data leaked', 'privacy breach', 'personal data misused', 'data breach', 'information theft', 'privacy rights', 'data protection', 'personal data leaked', 'aadhaar data leaked', 'pan data misuse', 'data misuse', 'privacy invasion', 'information security'],
+    
+    # ============ TAX LAW ============
+    'income_tax': ['income tax', 'itr', 'tax return', 'tax filing', 'tax refund', 'itr filing', 'income tax return', 'how to file itr', 'itr online', 'tax return filing', 'itr form', 'itr 1', 'itr 2', 'itr 3', 'itr 4', 'income tax refund', 'refund not received', 'itr verification', 'itr acknowledgement', 'tax deduction', 'section 80c', 'section 80d', 'tax exemption', 'tds', 'form 16', 'form 26as', 'pan card', 'aadhaar linking'],
+    'gst': ['gst', 'goods and services tax', 'gst return', 'gst registration', 'gst filing', 'gstr 1', 'gstr 3b', 'gst number', 'gst portal', 'gst refund', 'gst payment', 'gst compliance', 'gst invoice', 'gst notice', 'input tax credit', 'itc', 'gst rate', 'gst cancellation', 'gstin'],
+    'tax_penalty': ['tax penalty', 'tax notice', 'assessment', 'tax default', 'income tax notice', 'tax assessment order', 'tax demand notice', 'section 148 notice', 'section 143 notice', 'tax penalty notice', 'late filing penalty', 'tax evasion', 'tax appeal', 'cit appeal', 'tax dispute', 'tax arrears', 'tax recovery', 'tax litigation'],
+    
+    # ============ BANKING & LOAN ============
+    'loan_default': ['loan default', 'emi', 'loan recovery', 'unable to pay', 'loan problem', 'cannot pay emi', 'emi not paid', 'loan settlement', 'loan closure', 'default on loan', 'emi bounce', 'loan overdue', 'missed emi', 'emi default', 'loan restructuring', 'loan moratorium', 'one time settlement', 'loan write off', 'sarfaesi act', 'cibil score low', 'credit score affected', 'loan npa', 'loan account declared npa'],
+    'bank_fraud': ['bank fraud', 'fraudulent transaction', 'unauthorized transaction', 'money debited', 'unauthorized debit', 'fraud in account', 'atm fraud', 'bank account hacked', 'unauthorized withdrawal', 'fraud transaction', 'unknown debit', 'bank scam', 'fake transaction', 'duplicate card', 'skimming', 'atm skimming', 'card cloning', 'check fraud', 'cheque fraud', 'account takeover'],
+    'loan_harassment': ['loan harassment', 'recovery agent', 'bank harassment', 'threatening calls', 'recovery calls', 'loan app harassment', 'recovery agents threatening', 'illegal recovery', 'abusive recovery calls', 'recovery agent abuse', 'third party harassment', 'loan collection harassment', 'intimidation by recovery agent', 'threatening for loan', 'harassment by lender', 'harassment by nbfc', 'harassment by bank', 'recovery agent misbehavior', 'defamation by recovery agent', 'rbi complaint recovery'],
+    
+    # ============ CHEQUE BOUNCE ============
+    'cheque_bounce': ['cheque bounce', 'dishonoured cheque', 'cheque dishonor', 'insufficient funds', 'cheque returned', 'bounced cheque', 'cheque not cleared', 'cheque bounced', 'payment stopped', 'check bounce', 'cheque return', 'section 138', 'negotiable instruments act', 'cheque bounce case', 'cheque bounce complaint', 'cheque dishonor case', 'cheque bounce notice', 'legal notice cheque bounce', 'cheque bounce penalty', 'cheque bounce fine', 'cheque bounce compensation', 'stop payment cheque', 'insufficient balance'],
+    
+    # ============ MOTOR VEHICLES ============
+    'accident': ['accident', 'road accident', 'car accident', 'hit', 'collision', 'vehicle accident', 'bike accident', 'hit by car', 'met with accident', 'accident case', 'accident injury', 'serious accident', 'fatal accident', 'accident death', 'hit and run', 'accident victim', 'accident damage', 'truck accident', 'bus accident', 'auto accident', 'scooter accident', 'pedestrian accident', 'accident claim'],
+    'accident_compensation': ['accident compensation', 'insurance claim', 'vehicle insurance', 'compensation for accident', 'claim insurance', 'mact claim', 'motor accident claims tribunal', 'accident insurance', 'third party insurance', 'compensation amount', 'injury compensation', 'death compensation', 'accident settlement', 'insurance not paying', 'claim rejected', 'mact case', 'accident tribunal', 'vehicle insurance claim'],
+    'driving_license': ['driving license', 'dl', 'licence', 'driving permit', 'license suspended', 'get driving license', 'dl renewal', 'driving license renewal', 'dl expired', 'learn license', 'll', 'permanent license', 'driving test', 'rto test', 'dl application', 'duplicate dl', 'lost driving license', 'dl status', 'license verification', 'international driving permit', 'dl disqualification'],
+    'vehicle_registration': ['vehicle registration', 'rc', 'registration certificate', 'vehicle rc', 'rc transfer', 'change ownership', 'vehicle transfer', 'rc book', 'rc online', 'vehicle ownership transfer', 'duplicate rc', 'lost rc', 'rc renewal', 'rc expired', 'temporary registration', 'noc for vehicle', 'vehicle transfer procedure', 'rto transfer', 'inter state transfer'],
+    'traffic_challan': ['challan', 'fine', 'traffic violation', 'penalty', 'traffic fine', 'overspeeding', 'red light', 'traffic police fine', 'e challan', 'online challan', 'challan payment', 'traffic ticket', 'speeding ticket', 'parking fine', 'no helmet fine', 'drunk driving fine', 'signal jump', 'traffic rules violation', 'challan status', 'challan online payment', 'traffic offense', 'wrong parking fine', 'seatbelt violation'],
+    
+    # ============ REAL ESTATE (RERA) ============
+    'rera_complaint': ['builder delay', 'possession delay', 'flat delay', 'rera complaint', 'developer fraud', 'flat not delivered', 'construction not completed', 'builder cheating', 'property not handed over', 'rera case', 'builder default', 'project delayed', 'possession not given', 'flat booking', 'apartment delay', 'construction stopped', 'incomplete project', 'builder harassment', 'quality issues construction', 'apartment issues', 'flat defects', 'builder promises not kept', 'rera authority', 'rera hearing'],
+    'rera_refund': ['rera refund', 'builder refund', 'project cancelled', 'want refund from builder', 'get money back from builder', 'cancel flat booking', 'builder not refunding', 'refund with interest', 'rera refund order', 'flat cancellation', 'apartment refund', 'booking amount refund', 'rera compensation', 'refund from developer'],
+    
+    # ============ TENANT & LANDLORD ============
+    'rent_dispute': ['rent', 'tenant', 'landlord', 'eviction', 'rental agreement', 'rent increase', 'rent not paid', 'security deposit', 'landlord not returning deposit', 'tenant not paying rent', 'house rent problem', 'rent agreement', 'tenancy', 'lease agreement', 'rent dispute', 'deposit not returned', 'deposit refund', 'rent control', 'rent agreement registration', 'tenant rights', 'landlord rights', 'rent receipt', 'rent arrears', 'rent court', 'rent tribunal', 'leave and license'],
+    'eviction': ['evict', 'eviction', 'removal', 'vacate', 'eviction notice', 'vacate house', 'tenant not leaving', 'landlord forcing to leave', 'eviction order', 'illegal eviction', 'forceful eviction', 'eviction procedure', 'eviction case', 'eviction petition', 'tenant eviction', 'rent control eviction', 'unlawful eviction', 'eviction grounds', 'eviction period'],
+    
+    # ============ MEDICAL NEGLIGENCE ============
+    'medical_negligence': ['medical negligence', 'doctor negligence', 'wrong treatment', 'medical error', 'surgery mistake', 'wrong diagnosis', 'surgical error', 'medical malpractice', 'doctor carelessness', 'hospital negligence', 'wrong medicine', 'wrong surgery', 'medical mistake', 'treatment error', 'misdiagnosis', 'delayed treatment', 'improper treatment', 'negligent doctor', 'hospital mistake', 'operation mistake', 'anesthesia error', 'prescription error', 'lab report error', 'medical records error'],
+    'medical_compensation': ['medical compensation', 'hospital compensation', 'compensation for medical negligence', 'medical malpractice compensation', 'compensation for wrong treatment', 'medical claim', 'consumer court medical', 'medical negligence case', 'compensation from hospital', 'compensation from doctor'],
+    
+    # ============ INTELLECTUAL PROPERTY ============
+    'copyright': ['copyright', 'plagiarism', 'content theft', 'copied work', 'copyright infringement', 'copyright violation', 'piracy', 'unauthorized use', 'content copy', 'music copyright', 'book copyright', 'video copyright', 'image copyright', 'copyright registration', 'dmca', 'copyright claim', 'copyright strike', 'youtube copyright', 'website content copied', 'copyright law'],
+    'trademark': ['trademark', 'brand name', 'logo', 'brand protection', 'trademark registration', 'trademark infringement', 'trademark violation', 'logo copied', 'brand name copied', 'trademark dispute', 'tm registration', 'brand registration', 'logo registration', 'trademark objection', 'trademark application', 'trademark search'],
+    'patent': ['patent', 'invention', 'innovation', 'patent registration', 'patent infringement', 'patent application', 'patent procedure', 'patent protection', 'patent violation', 'patent dispute', 'patent claim', 'patent filing', 'patent search', 'patent agent'],
+    
+    # ============ COMPANY & BUSINESS ============
+    'company_dispute': ['company dispute', 'business dispute', 'partnership dispute', 'shareholder', 'shareholder dispute', 'director dispute', 'partner dispute', 'business disagreement', 'company disagreement', 'partnership conflict', 'share transfer', 'company deadlock', 'oppression and mismanagement', 'winding up', 'nclt case'],
+    'company_registration': ['company registration', 'business registration', 'startup registration', 'company incorporation', 'pvt ltd registration', 'llp registration', 'proprietorship', 'partnership registration', 'opc registration', 'roc registration', 'mca registration', 'startup india', 'msme registration', 'udyam registration', 'gst registration business', 'cin number', 'company name'],
+    
+    # ============ CONTRACT LAW ============
+    'contract_breach': ['breach of contract', 'contract violation', 'agreement broken', 'contract dispute', 'contract not honored', 'agreement violation', 'contract default', 'breach of agreement', 'contract broken', 'contract terms violated', 'compensation for breach', 'damages for breach', 'contract lawsuit', 'specific performance', 'contract enforcement'],
+    'contract_drafting': ['contract', 'agreement', 'mou', 'draft agreement', 'contract drafting', 'legal agreement', 'contract preparation', 'agreement format', 'contract terms', 'service agreement', 'vendor agreement', 'nda', 'non disclosure agreement', 'employment contract', 'lease deed', 'sale agreement', 'partnership deed', 'shareholders agreement'],
+    
+    # ============ SC/ST ACT ============
+    'caste_discrimination': ['caste discrimination', 'atrocity', 'sc st', 'dalit', 'scheduled caste', 'scheduled tribe', 'sc st act', 'atrocity act', 'caste abuse', 'caste harassment', 'caste violence', 'untouchability', 'caste insult', 'caste discrimination case', 'sc st commission', 'sc st complaint', 'sc st fir', 'social discrimination', 'caste based violence', 'atrocity case'],
+    
+    # ============ DISABILITY RIGHTS ============
+    'disability_discrimination': ['disability', 'disabled', 'handicap', 'specially abled', 'pwd', 'disability rights', 'disabled person', 'disability discrimination', 'disability certificate', 'pwd certificate', 'disability pension', 'disability benefits', 'disability act', 'rpwd act', 'accessibility rights', 'disability employment', 'disability reservation', 'disability concession', 'disability discrimination case'],
+    
+    # ============ SENIOR CITIZEN RIGHTS ============
+    'senior_citizen': ['senior citizen', 'old age', 'elderly', 'parents maintenance', 'senior citizen rights', 'maintenance of parents', 'parents not caring', 'children not caring for parents', 'senior citizen maintenance act', 'tribunal for parents', 'old age home', 'senior citizen welfare', 'elderly abuse', 'elderly neglect', 'senior citizen pension', 'maintenance order parents', 'parents maintenance case', 'section 125 parents'],
+    
+    # ============ CHILD RIGHTS (POCSO) ============
+    'child_abuse': ['child abuse', 'pocso', 'minor', 'child safety', 'sexual assault child', 'child protection', 'pocso act', 'child sexual abuse', 'child molestation', 'child assault', 'child harassment', 'child exploitation', 'child pornography', 'child trafficking', 'child labour', 'child marriage', 'child rights', 'juvenile justice', 'child welfare', 'protect child', 'child in danger', 'pocso case', 'pocso complaint'],
+    
+    # ============ ENVIRONMENTAL LAW ============
+    'pollution': ['pollution', 'environment', 'air quality', 'water pollution', 'noise pollution', 'air pollution', 'environmental pollution', 'factory pollution', 'industrial pollution', 'river pollution', 'noise', 'smoke', 'toxic waste', 'chemical pollution', 'environmental damage', 'pollution control', 'pollution law', 'environment protection'],
+    'environmental_complaint': ['environmental complaint', 'pollution board', 'green tribunal', 'ngt', 'national green tribunal', 'pollution complaint', 'environmental case', 'pollution board complaint', 'spcb', 'cpcb', 'environmental violation', 'forest violation', 'tree cutting', 'deforestation', 'wildlife protection', 'environmental clearance'],
+    
+    # ============ AGRICULTURE LAW ============
+    'crop_insurance': ['crop insurance', 'kisan', 'farmer', 'agricultural', 'fasal bima', 'pmfby', 'crop damage', 'crop loss', 'farmer insurance', 'agricultural insurance', 'kisan credit card', 'farmer loan', 'krishi loan', 'crop insurance claim'],
+    'land_acquisition': ['land acquisition', 'government land', 'compensation', 'land acquired', 'land taken by government', 'acquisition compensation', 'land acquisition act', 'land compensation', 'eminent domain', 'compulsory acquisition', 'land acquisition case', 'adequate compensation', 'land acquisition procedure'],
+    
+    # ============ GENERAL LEGAL INFORMATION ============
+    'self_representation': ['represent myself', 'without lawyer', 'no lawyer', 'self representation', 'represent own case', 'fight own case', 'can i represent', 'do i need lawyer', 'represent self', 'without advocate', 'no advocate', 'fight case myself', 'handle case myself', 'pro se', 'in person representation', 'self represent', 'myself in court'],
+    'legal_procedure': ['file case', 'case procedure', 'court procedure', 'legal procedure', 'how to file', 'court process', 'legal process', 'case process', 'filing procedure', 'court filing', 'legal system', 'court system'],
+    'legal_aid': ['legal aid', 'free lawyer', 'free legal', 'nalsa', 'dlsa', 'legal services authority', 'free legal services', 'pro bono', 'government lawyer free'],
+}
+
+def build_context_automaton():
+    """
+    Compile every context pattern into one Aho-Corasick automaton
+    A single pass over the query then reports all patterns it contains,
+    instead of one substring search per pattern (~1000 of them)
+    """
+    if ahocorasick is None:
+        return None
+    
+    # Pattern -> names of the contexts it belongs to
+    pattern_contexts = {}
+    for context_name, patterns in QUERY_CONTEXT_PATTERNS.items():
+        for pattern in patterns:
+            pattern_contexts.setdefault(pattern, set()).add(context_name)
+    
+    automaton = ahocorasick.Automaton()
+    for pattern, context_names in pattern_contexts.items():
+        automaton.add_word(pattern, frozenset(context_names))
+    automaton.make_automaton()
+    return automaton
+
+QUERY_CONTEXT_AUTOMATON = build_context_automaton()
+
+@lru_cache(maxsize=256)
 def extract_query_context(query):
     """
     COMPREHENSIVE CONTEXT EXTRACTION FOR ALL 27 LEGAL CATEGORIES
@@ -7366,147 +7691,30 @@ def extract_query_context(query):
     Extracts the REAL context and intent from the query.
     Prevents false matches by understanding what the user REALLY wants.
     
+    Memoized: find_best_match() scores every entry against the same query,
+    so the pattern scan runs once per query instead of once per entry.
+    Returns an immutable tuple so cached results cannot be modified.
+    
     Example: "police harassment" → 'rights_harassment' (NOT 'fir_filing')
     """
     query_lower = query.lower()
     
-    # COMPREHENSIVE context patterns for ALL legal categories
-    context_patterns = {
-        # ============ CRIMINAL LAW ============
-        'fir_filing': ['file fir', 'lodge fir', 'register fir', 'fir process', 'how to file complaint', 'lodge complaint', 'police station', 'report crime', 'complaint against', 'register case', 'file case', 'report to police', 'fir copy', 'zero fir', 'online fir', 'fir not registered', 'police not registering fir', 'complaint procedure', 'police complaint', 'criminal complaint', 'fir against', 'register criminal case', 'complaint in police station', 'nc complaint', 'crime report', 'police report', 'first information report', 'fir format', 'fir sample', 'fir registration', 'how to lodge fir'],
-        'bail': ['bail', 'release', 'custody', 'grant bail', 'bail application', 'anticipatory bail', 'get bail', 'apply for bail', 'bail conditions', 'bail amount', 'bail rejected', 'bail hearing', 'bail bond', 'bail order', 'how to get bail', 'bail procedure', 'bail in non bailable offence', 'bail in bailable offence', 'bail plea', 'bail petition', 'surety for bail', 'regular bail', 'interim bail', 'bail cancellation', 'bail grounds'],
-        'arrest': ['arrested', 'arrest procedure', 'custody', 'detention', 'police custody', 'taken into custody', 'under arrest', 'arrested by police', 'arrest warrant', 'wrongful arrest', 'illegal arrest', 'arrest without warrant', 'rights after arrest', 'arrest memo', 'judicial custody', 'remand', 'police remand', 'rights when arrested', 'what to do if arrested', 'arrest rights', 'unlawful arrest'],
-        
-        # ============ CONSTITUTIONAL RIGHTS & CONSTITUTION ============
-        'rights_harassment': ['harass', 'threaten', 'abuse', 'wrongly', 'false', 'illegal', 'my rights', 'protect me', 'fundamental rights', 'violated', 'rights violated', 'harassment by authority', 'police harassment', 'government harassment', 'official harassment', 'constitutional rights', 'human rights', 'civil rights', 'liberty', 'freedom', 'rights protection', 'violation of rights', 'abuse of power', 'misuse of authority', 'wrongful detention', 'illegal detention'],
-        'rights_enforcement': ['enforce rights', 'writ', 'petition', 'supreme court', 'high court', 'article 21', 'article 32', 'writ petition', 'habeas corpus', 'mandamus', 'certiorari', 'prohibition', 'quo warranto', 'file writ', 'writ jurisdiction', 'constitutional petition', 'pil', 'public interest litigation', 'fundamental rights petition', 'writ hearing', 'writ procedure'],
-        'constitution_general': ['constitution', 'indian constitution', 'constitutional law', 'constitutional provisions', 'part iii', 'part iv', 'preamble', 'basic structure', 'kesavananda bharati', 'constitutional amendments', 'constitutional validity', 'constituent assembly'],
-        'fundamental_rights': ['fundamental rights', 'article 14', 'article 15', 'article 16', 'article 19', 'article 20', 'article 21', 'article 21a', 'article 22', 'article 23', 'article 24', 'article 25', 'article 26', 'article 29', 'article 30', 'right to equality', 'right to freedom', 'right to life', 'right to education', 'freedom of speech', 'freedom of religion', 'cultural rights', 'right against exploitation', 'articles 12-35'],
-        'directive_principles': ['directive principles', 'dpsp', 'article 36', 'article 37', 'article 38', 'article 39', 'article 40', 'article 41', 'article 42', 'article 43', 'article 44', 'article 45', 'article 46', 'article 47', 'article 48', 'article 48a', 'article 49', 'article 50', 'article 51', 'uniform civil code', 'state policy', 'non-justiciable', 'gandhian principles', 'socialistic principles', 'part iv constitution', 'welfare state', 'panchayati raj', 'free legal aid', 'environment protection', 'living wage', 'article 39a'],
-        'landmark_cases': ['landmark case', 'supreme court case', 'landmark judgment', 'famous case', 'important case', 'maneka gandhi', 'kesavananda bharati', 'minerva mills', 'golaknath', 'indra sawhney', 'mandal commission', 'shah bano', 'vishaka', 'puttaswamy', 'privacy case', 'section 377', 'navtej singh johar', 'shreya singhal', 'olga tellis', 'mc mehta', 'basic structure doctrine', 'reservation case', 'triple talaq', 'sabarimala', 'aadhaar case', 'judicial review', 'constitutional case law'],
-        'emergency_provisions': ['emergency', 'national emergency', 'president rule', 'article 352', 'article 356', 'article 360', 'financial emergency', 'suspension of rights', 'emergency provisions', 'state emergency', 'constitutional emergency'],
-        'writs_detailed': ['writ of habeas corpus', 'writ of mandamus', 'writ of certiorari', 'writ of prohibition', 'writ of quo warranto', 'article 32 petition', 'article 226 petition', 'constitutional remedies', 'writ types', 'five writs', 'writ jurisdiction', 'file writ petition', 'supreme court writ', 'high court writ'],
-        
-        # ============ FAMILY LAW ============
-        'divorce': ['divorce', 'divorse', 'separation', 'breakup', 'end marriage', 'dissolve marriage', 'divorce case', 'divorce lawyer', 'divorce petition', 'divorce application', 'judicial separation', 'nullity of marriage', 'void marriage', 'annulment'],
-        'divorce_mutual': ['mutual consent', 'both want', 'both agree', 'both interested', 'both willing', 'amicable', 'mutual divorce', 'agreed divorce', 'uncontested divorce', 'we both want divorce', 'husband wife agree', 'peaceful divorce', 'no contest divorce', 'consent divorce', 'amicable separation', 'joint petition'],
-        'divorce_grounds': ['grounds', 'reason for divorce', 'cause for divorce', 'basis for divorce', 'grounds for divorce', 'divorce reasons', 'valid grounds', 'adultery', 'cruelty', 'desertion', 'mental cruelty', 'physical cruelty', 'grounds under hindu marriage act', 'section 13 grounds'],
-        'divorce_procedure': ['divorce process', 'divorce procedure', 'how to divorce', 'divorce steps', 'file divorce', 'divorce filing', 'how to file divorce', 'divorce court', 'family court', 'divorce petition format', 'divorce documents', 'divorce timeline', 'how long divorce takes'],
-        'maintenance': ['alimony', 'maintenance', 'support', 'financial support', 'monthly payment', 'wife maintenance', 'interim maintenance', 'permanent alimony', 'maintenance amount', 'how much alimony', 'section 125 crpc', 'maintenance case', 'maintenance order', 'spousal support', 'maintenance for wife', 'maintenance for child', 'maintenance claim'],
-        'custody': ['child custody', 'custody', 'visitation', 'children', 'parenting', 'custody battle', 'child custody case', 'custody rights', 'visitation rights', 'who gets child', 'custody of children', 'guardianship', 'minor custody', 'custody order', 'joint custody', 'sole custody', 'custody after divorce'],
-        
-        # ============ PROPERTY LAW ============
-        'property_registration': ['register property', 'property registration', 'house registration', 'deed registration', 'registry', 'how to register', 'registration process', 'register deed', 'property documents', 'stamp duty', 'register house', 'register land', 'sub registrar', 'registration fee', 'mutation', 'registry office'],
-        'property_inheritance': ['inheritance', 'succession', 'after death', 'parents demise', 'ancestral property', 'legal heir', 'will', 'succession certificate', 'father died', 'mother died', 'parent death', 'inherit property', 'property after death', 'will property', 'intestate succession', 'legal heir certificate', 'partition', 'ancestral land', 'family property', 'share in property'],
-        'property_dispute': ['property dispute', 'land dispute', 'ownership', 'claim', 'encroachment', 'illegally occupied', 'illegal occupation', 'someone occupied', 'occupied my land', 'get back my land', 'get back my property', 'trespassing', 'unauthorized possession', 'forceful possession', 'kabza', 'possession dispute', 'boundary dispute', 'title dispute', 'fake documents', 'forged papers', 'someone took my land', 'neighbor encroached', 'trespasser on property', 'squatters', 'illegal construction on my land', 'someone built on my land', 'remove illegal occupants', 'reclaim property', 'possession back', 'land grabbing', 'illegal settler', 'encroachment removal', 'boundary wall dispute', 'land grabber', 'property theft', 'fraudulent sale', 'property fraud', 'forged sale deed', 'fake registry', 'title suit', 'injunction', 'stay order', 'civil suit for possession'],
-        'property_transfer': ['transfer property', 'gift deed', 'sale deed', 'mutation', 'property transfer deed', 'transfer ownership', 'property sale', 'sell property', 'buy property', 'transfer land', 'change ownership', 'property buyer', 'property seller'],
-        
-        # ============ EMPLOYMENT LAW ============
-        'employment_termination': ['fired', 'termination', 'dismissed', 'removal', 'lost job', 'wrongful termination', 'terminated', 'sacked', 'removed from job', 'job loss', 'unfair dismissal', 'illegal termination', 'termination without notice', 'termination letter', 'wrongful dismissal', 'illegal firing', 'unfair firing', 'termination compensation', 'termination notice', 'retrenchment', 'layoff', 'forced resignation', 'constructive dismissal', 'termination without reason', 'arbitrary termination', 'termination during probation', 'termination appeal', 'reinstatement', 'job back', 'termination illegal'],
-        'employment_salary': ['salary', 'wages', 'payment', 'dues', 'unpaid', 'compensation', 'salary not paid', 'pending salary', 'wage not received', 'payment pending', 'salary delay', 'withheld salary', 'salary not received', 'pending dues', 'salary dispute', 'wage dispute', 'non payment of salary', 'salary claim', 'salary recovery', 'salary arrears', 'unpaid wages', 'wage theft', 'salary withheld', 'employer not paying', 'salary complaint', 'labour commissioner salary', 'salary legal action', 'recover salary', 'salary court case'],
-        'employment_rights': ['employee rights', 'labour rights', 'working conditions', 'overtime', 'work hours', 'workplace rights', 'exploitation', 'labour law', 'employee benefits', 'working hours violation', 'overtime pay', 'workplace harassment', 'discrimination at work', 'employee exploitation', 'forced work', 'labour rights violation', 'workplace safety', 'employee grievance', 'labour complaint'],
-        'employment_resignation': ['resign', 'resignation', 'notice period', 'quit job', 'leave job', 'want to resign', 'how to resign', 'leaving job', 'resignation letter', 'resignation acceptance', 'resignation withdrawal', 'notice period buyout', 'resignation without notice', 'relieving letter', 'experience letter', 'full and final settlement', 'resignation process', 'resignation rules', 'immediate resignation', 'resignation law'],
-        'pf_gratuity': ['pf', 'provident fund', 'gratuity', 'epf', 'pension', 'pf withdrawal', 'gratuity claim', 'epf transfer', 'retirement benefits', 'pf balance', 'pf claim', 'pf not deposited', 'employer not depositing pf', 'epf withdrawal', 'pf transfer online', 'gratuity eligibility', 'gratuity calculation', 'gratuity payment', 'pf claim rejection', 'eps pension', 'pf passbook', 'uan', 'pf account', 'gratuity not paid', 'pf settlement'],
-        
-        # ============ CONSUMER LAW ============
-        'consumer_defective': ['defective', 'faulty', 'broken', 'damaged', 'poor quality', 'defective product', 'not working', 'malfunctioning', 'product issue', 'manufacturing defect', 'product defect', 'faulty goods', 'broken product', 'damaged goods', 'product failure', 'defective item', 'product not working', 'faulty product', 'quality issue', 'substandard product', 'inferior quality', 'product complaint'],
-        'consumer_refund': ['refund', 'return', 'money back', 'reimbursement', 'want refund', 'get refund', 'return product', 'exchange', 'refund policy', 'return policy', 'refund request', 'refund denied', 'refund procedure', 'how to get refund', 'refund not given', 'seller not refunding', 'shop not refunding', 'refund claim', 'refund complaint', 'exchange product', 'product return'],
-        'consumer_complaint': ['consumer complaint', 'consumer forum', 'file complaint', 'consumer court', 'complain against shop', 'complaint against seller', 'how to complain', 'consumer grievance', 'consumer redressal', 'consumer protection', 'consumer case', 'consumer court complaint', 'online consumer complaint', 'consumer helpline', 'consumer complaint format', 'consumer complaint procedure', 'district consumer forum', 'state consumer commission', 'national consumer commission'],
-        'consumer_service': ['service deficiency', 'poor service', 'bad service', 'service problem', 'service not provided', 'delayed service', 'deficient service', 'service complaint', 'service issue', 'unsatisfactory service', 'service failure', 'service quality', 'service dispute', 'service provider complaint'],
-        'consumer_warranty': ['warranty', 'guarantee', 'replacement', 'warranty claim', 'under warranty', 'warranty expired', 'warranty period', 'warranty card', 'warranty rejection', 'warranty not honored', 'guarantee period', 'manufacturer warranty', 'warranty service', 'warranty claim rejected', 'replacement under warranty'],
-        
-        # ============ EDUCATION LAW ============
-        'education_corporal': ['beat', 'beating', 'hit', 'slap', 'corporal', 'physical punishment', 'teacher beats', 'teacher hit', 'corporal punishment', 'teacher beating student', 'physical punishment by teacher', 'teacher slapping', 'teacher violence', 'punishment by teacher', 'teacher abuse', 'student beaten', 'teacher assault', 'school punishment', 'teacher harassment', 'severe punishment', 'teacher misconduct', 'physical abuse by teacher'],
-        'education_admission': ['admission', 'rte', 'school admission', 'college admission', 'enrollment', 'admission process', 'admission denied', 'admission criteria', 'admission quota', 'school enrollment', 'admission fee', 'admission procedure', 'right to education admission', 'rte admission', 'free admission', 'admission age', 'admission documents', 'admission appeal', 'admission seat', 'nursery admission', 'kg admission', 'class 1 admission'],
-        'education_fee': ['school fee', 'college fee', 'tuition', 'fee structure', 'donation', 'school fees high', 'fee hike', 'tuition fee', 'education fee', 'fee complaint', 'excessive fee', 'fee refund', 'fee issue', 'capitation fee', 'donation for admission', 'illegal fee', 'fee not affordable', 'fee waiver', 'fee concession', 'school charging extra', 'hidden charges'],
-        'education_rights': ['right to education', 'free education', 'education rights', 'rte act', 'education for all', 'compulsory education', 'free and compulsory education', 'child education rights', 'education law', 'school rights', 'student rights', 'education violation'],
-        
-        # ============ CYBER LAW ============
-        'cyber_fraud': ['online fraud', 'cyber fraud', 'internet fraud', 'phishing', 'scam', 'hacking', 'online scam', 'upi fraud', 'payment fraud', 'account hacked', 'money stolen online', 'fake website', 'fraudulent transaction', 'online payment fraud', 'credit card fraud', 'debit card fraud', 'netbanking fraud', 'wallet fraud', 'paytm fraud', 'gpay fraud', 'phonepe fraud', 'fraud email', 'fraud sms', 'otp fraud', 'vishing', 'smishing', 'fake app', 'scam website', 'lottery scam', 'job scam online', 'investment scam', 'dating scam', 'facebook scam', 'whatsapp scam', 'instagram scam', 'olx fraud', 'amazon fraud', 'flipkart fraud'],
-        'cyber_harassment': ['cyber harassment', 'online harassment', 'cyberbullying', 'trolling', 'online abuse', 'social media harassment', 'online threats', 'morphed photos', 'defamation online', 'cyberstalking', 'online stalking', 'social media abuse', 'fake profile', 'impersonation online', 'reputation damage', 'online blackmail', 'revenge porn', 'intimate images leaked', 'cyber stalking', 'online intimidation', 'harassment on facebook', 'harassment on instagram', 'harassment on twitter', 'whatsapp harassment', 'email harassment'],
-        'cyber_complaint': ['cyber complaint', 'cyber crime', 'report online', 'cyber cell', 'report cyber crime', 'complaint to cyber police', 'how to report online fraud', 'cyber crime complaint', 'online fir cyber', 'cybercrime portal', 'report phishing', 'report hacking', 'national cyber crime portal', 'cyber complaint online', 'cyber police complaint', 'cyber helpline', 'cybercrime reporting'],
-        'cyber_privacy': ['data privacy', 'data theft', 'personal information', 'privacy violation', 'data leaked', 'privacy breach', 'personal data misused', 'data breach', 'information theft', 'privacy rights', 'data protection', 'personal data leaked', 'aadhaar data leaked', 'pan data misuse', 'data misuse', 'privacy invasion', 'information security'],
-        
-        # ============ TAX LAW ============
-        'income_tax': ['income tax', 'itr', 'tax return', 'tax filing', 'tax refund', 'itr filing', 'income tax return', 'how to file itr', 'itr online', 'tax return filing', 'itr form', 'itr 1', 'itr 2', 'itr 3', 'itr 4', 'income tax refund', 'refund not received', 'itr verification', 'itr acknowledgement', 'tax deduction', 'section 80c', 'section 80d', 'tax exemption', 'tds', 'form 16', 'form 26as', 'pan card', 'aadhaar linking'],
-        'gst': ['gst', 'goods and services tax', 'gst return', 'gst registration', 'gst filing', 'gstr 1', 'gstr 3b', 'gst number', 'gst portal', 'gst refund', 'gst payment', 'gst compliance', 'gst invoice', 'gst notice', 'input tax credit', 'itc', 'gst rate', 'gst cancellation', 'gstin'],
-        'tax_penalty': ['tax penalty', 'tax notice', 'assessment', 'tax default', 'income tax notice', 'tax assessment order', 'tax demand notice', 'section 148 notice', 'section 143 notice', 'tax penalty notice', 'late filing penalty', 'tax evasion', 'tax appeal', 'cit appeal', 'tax dispute', 'tax arrears', 'tax recovery', 'tax litigation'],
-        
-        # ============ BANKING & LOAN ============
-        'loan_default': ['loan default', 'emi', 'loan recovery', 'unable to pay', 'loan problem', 'cannot pay emi', 'emi not paid', 'loan settlement', 'loan closure', 'default on loan', 'emi bounce', 'loan overdue', 'missed emi', 'emi default', 'loan restructuring', 'loan moratorium', 'one time settlement', 'loan write off', 'sarfaesi act', 'cibil score low', 'credit score affected', 'loan npa', 'loan account declared npa'],
-        'bank_fraud': ['bank fraud', 'fraudulent transaction', 'unauthorized transaction', 'money debited', 'unauthorized debit', 'fraud in account', 'atm fraud', 'bank account hacked', 'unauthorized withdrawal', 'fraud transaction', 'unknown debit', 'bank scam', 'fake transaction', 'duplicate card', 'skimming', 'atm skimming', 'card cloning', 'check fraud', 'cheque fraud', 'account takeover'],
-        'loan_harassment': ['loan harassment', 'recovery agent', 'bank harassment', 'threatening calls', 'recovery calls', 'loan app harassment', 'recovery agents threatening', 'illegal recovery', 'abusive recovery calls', 'recovery agent abuse', 'third party harassment', 'loan collection harassment', 'intimidation by recovery agent', 'threatening for loan', 'harassment by lender', 'harassment by nbfc', 'harassment by bank', 'recovery agent misbehavior', 'defamation by recovery agent', 'rbi complaint recovery'],
-        
-        # ============ CHEQUE BOUNCE ============
-        'cheque_bounce': ['cheque bounce', 'dishonoured cheque', 'cheque dishonor', 'insufficient funds', 'cheque returned', 'bounced cheque', 'cheque not cleared', 'cheque bounced', 'payment stopped', 'check bounce', 'cheque return', 'section 138', 'negotiable instruments act', 'cheque bounce case', 'cheque bounce complaint', 'cheque dishonor case', 'cheque bounce notice', 'legal notice cheque bounce', 'cheque bounce penalty', 'cheque bounce fine', 'cheque bounce compensation', 'stop payment cheque', 'insufficient balance'],
-        
-        # ============ MOTOR VEHICLES ============
-        'accident': ['accident', 'road accident', 'car accident', 'hit', 'collision', 'vehicle accident', 'bike accident', 'hit by car', 'met with accident', 'accident case', 'accident injury', 'serious accident', 'fatal accident', 'accident death', 'hit and run', 'accident victim', 'accident damage', 'truck accident', 'bus accident', 'auto accident', 'scooter accident', 'pedestrian accident', 'accident claim'],
-        'accident_compensation': ['accident compensation', 'insurance claim', 'vehicle insurance', 'compensation for accident', 'claim insurance', 'mact claim', 'motor accident claims tribunal', 'accident insurance', 'third party insurance', 'compensation amount', 'injury compensation', 'death compensation', 'accident settlement', 'insurance not paying', 'claim rejected', 'mact case', 'accident tribunal', 'vehicle insurance claim'],
-        'driving_license': ['driving license', 'dl', 'licence', 'driving permit', 'license suspended', 'get driving license', 'dl renewal', 'driving license renewal', 'dl expired', 'learn license', 'll', 'permanent license', 'driving test', 'rto test', 'dl application', 'duplicate dl', 'lost driving license', 'dl status', 'license verification', 'international driving permit', 'dl disqualification'],
-        'vehicle_registration': ['vehicle registration', 'rc', 'registration certificate', 'vehicle rc', 'rc transfer', 'change ownership', 'vehicle transfer', 'rc book', 'rc online', 'vehicle ownership transfer', 'duplicate rc', 'lost rc', 'rc renewal', 'rc expired', 'temporary registration', 'noc for vehicle', 'vehicle transfer procedure', 'rto transfer', 'inter state transfer'],
-        'traffic_challan': ['challan', 'fine', 'traffic violation', 'penalty', 'traffic fine', 'overspeeding', 'red light', 'traffic police fine', 'e challan', 'online challan', 'challan payment', 'traffic ticket', 'speeding ticket', 'parking fine', 'no helmet fine', 'drunk driving fine', 'signal jump', 'traffic rules violation', 'challan status', 'challan online payment', 'traffic offense', 'wrong parking fine', 'seatbelt violation'],
-        
-        # ============ REAL ESTATE (RERA) ============
-        'rera_complaint': ['builder delay', 'possession delay', 'flat delay', 'rera complaint', 'developer fraud', 'flat not delivered', 'construction not completed', 'builder cheating', 'property not handed over', 'rera case', 'builder default', 'project delayed', 'possession not given', 'flat booking', 'apartment delay', 'construction stopped', 'incomplete project', 'builder harassment', 'quality issues construction', 'apartment issues', 'flat defects', 'builder promises not kept', 'rera authority', 'rera hearing'],
-        'rera_refund': ['rera refund', 'builder refund', 'project cancelled', 'want refund from builder', 'get money back from builder', 'cancel flat booking', 'builder not refunding', 'refund with interest', 'rera refund order', 'flat cancellation', 'apartment refund', 'booking amount refund', 'rera compensation', 'refund from developer'],
-        
-        # ============ TENANT & LANDLORD ============
-        'rent_dispute': ['rent', 'tenant', 'landlord', 'eviction', 'rental agreement', 'rent increase', 'rent not paid', 'security deposit', 'landlord not returning deposit', 'tenant not paying rent', 'house rent problem', 'rent agreement', 'tenancy', 'lease agreement', 'rent dispute', 'deposit not returned', 'deposit refund', 'rent control', 'rent agreement registration', 'tenant rights', 'landlord rights', 'rent receipt', 'rent arrears', 'rent court', 'rent tribunal', 'leave and license'],
-        'eviction': ['evict', 'eviction', 'removal', 'vacate', 'eviction notice', 'vacate house', 'tenant not leaving', 'landlord forcing to leave', 'eviction order', 'illegal eviction', 'forceful eviction', 'eviction procedure', 'eviction case', 'eviction petition', 'tenant eviction', 'rent control eviction', 'unlawful eviction', 'eviction grounds', 'eviction period'],
-        
-        # ============ MEDICAL NEGLIGENCE ============
-        'medical_negligence': ['medical negligence', 'doctor negligence', 'wrong treatment', 'medical error', 'surgery mistake', 'wrong diagnosis', 'surgical error', 'medical malpractice', 'doctor carelessness', 'hospital negligence', 'wrong medicine', 'wrong surgery', 'medical mistake', 'treatment error', 'misdiagnosis', 'delayed treatment', 'improper treatment', 'negligent doctor', 'hospital mistake', 'operation mistake', 'anesthesia error', 'prescription error', 'lab report error', 'medical records error'],
-        'medical_compensation': ['medical compensation', 'hospital compensation', 'compensation for medical negligence', 'medical malpractice compensation', 'compensation for wrong treatment', 'medical claim', 'consumer court medical', 'medical negligence case', 'compensation from hospital', 'compensation from doctor'],
-        
-        # ============ INTELLECTUAL PROPERTY ============
-        'copyright': ['copyright', 'plagiarism', 'content theft', 'copied work', 'copyright infringement', 'copyright violation', 'piracy', 'unauthorized use', 'content copy', 'music copyright', 'book copyright', 'video copyright', 'image copyright', 'copyright registration', 'dmca', 'copyright claim', 'copyright strike', 'youtube copyright', 'website content copied', 'copyright law'],
-        'trademark': ['trademark', 'brand name', 'logo', 'brand protection', 'trademark registration', 'trademark infringement', 'trademark violation', 'logo copied', 'brand name copied', 'trademark dispute', 'tm registration', 'brand registration', 'logo registration', 'trademark objection', 'trademark application', 'trademark search'],
-        'patent': ['patent', 'invention', 'innovation', 'patent registration', 'patent infringement', 'patent application', 'patent procedure', 'patent protection', 'patent violation', 'patent dispute', 'patent claim', 'patent filing', 'patent search', 'patent agent'],
-        
-        # ============ COMPANY & BUSINESS ============
-        'company_dispute': ['company dispute', 'business dispute', 'partnership dispute', 'shareholder', 'shareholder dispute', 'director dispute', 'partner dispute', 'business disagreement', 'company disagreement', 'partnership conflict', 'share transfer', 'company deadlock', 'oppression and mismanagement', 'winding up', 'nclt case'],
-        'company_registration': ['company registration', 'business registration', 'startup registration', 'company incorporation', 'pvt ltd registration', 'llp registration', 'proprietorship', 'partnership registration', 'opc registration', 'roc registration', 'mca registration', 'startup india', 'msme registration', 'udyam registration', 'gst registration business', 'cin number', 'company name'],
-        
-        # ============ CONTRACT LAW ============
-        'contract_breach': ['breach of contract', 'contract violation', 'agreement broken', 'contract dispute', 'contract not honored', 'agreement violation', 'contract default', 'breach of agreement', 'contract broken', 'contract terms violated', 'compensation for breach', 'damages for breach', 'contract lawsuit', 'specific performance', 'contract enforcement'],
-        'contract_drafting': ['contract', 'agreement', 'mou', 'draft agreement', 'contract drafting', 'legal agreement', 'contract preparation', 'agreement format', 'contract terms', 'service agreement', 'vendor agreement', 'nda', 'non disclosure agreement', 'employment contract', 'lease deed', 'sale agreement', 'partnership deed', 'shareholders agreement'],
-        
-        # ============ SC/ST ACT ============
-        'caste_discrimination': ['caste discrimination', 'atrocity', 'sc st', 'dalit', 'scheduled caste', 'scheduled tribe', 'sc st act', 'atrocity act', 'caste abuse', 'caste harassment', 'caste violence', 'untouchability', 'caste insult', 'caste discrimination case', 'sc st commission', 'sc st complaint', 'sc st fir', 'social discrimination', 'caste based violence', 'atrocity case'],
-        
-        # ============ DISABILITY RIGHTS ============
-        'disability_discrimination': ['disability', 'disabled', 'handicap', 'specially abled', 'pwd', 'disability rights', 'disabled person', 'disability discrimination', 'disability certificate', 'pwd certificate', 'disability pension', 'disability benefits', 'disability act', 'rpwd act', 'accessibility rights', 'disability employment', 'disability reservation', 'disability concession', 'disability discrimination case'],
-        
-        # ============ SENIOR CITIZEN RIGHTS ============
-        'senior_citizen': ['senior citizen', 'old age', 'elderly', 'parents maintenance', 'senior citizen rights', 'maintenance of parents', 'parents not caring', 'children not caring for parents', 'senior citizen maintenance act', 'tribunal for parents', 'old age home', 'senior citizen welfare', 'elderly abuse', 'elderly neglect', 'senior citizen pension', 'maintenance order parents', 'parents maintenance case', 'section 125 parents'],
-        
-        # ============ CHILD RIGHTS (POCSO) ============
-        'child_abuse': ['child abuse', 'pocso', 'minor', 'child safety', 'sexual assault child', 'child protection', 'pocso act', 'child sexual abuse', 'child molestation', 'child assault', 'child harassment', 'child exploitation', 'child pornography', 'child trafficking', 'child labour', 'child marriage', 'child rights', 'juvenile justice', 'child welfare', 'protect child', 'child in danger', 'pocso case', 'pocso complaint'],
-        
-        # ============ ENVIRONMENTAL LAW ============
-        'pollution': ['pollution', 'environment', 'air quality', 'water pollution', 'noise pollution', 'air pollution', 'environmental pollution', 'factory pollution', 'industrial pollution', 'river pollution', 'noise', 'smoke', 'toxic waste', 'chemical pollution', 'environmental damage', 'pollution control', 'pollution law', 'environment protection'],
-        'environmental_complaint': ['environmental complaint', 'pollution board', 'green tribunal', 'ngt', 'national green tribunal', 'pollution complaint', 'environmental case', 'pollution board complaint', 'spcb', 'cpcb', 'environmental violation', 'forest violation', 'tree cutting', 'deforestation', 'wildlife protection', 'environmental clearance'],
-        
-        # ============ AGRICULTURE LAW ============
-        'crop_insurance': ['crop insurance', 'kisan', 'farmer', 'agricultural', 'fasal bima', 'pmfby', 'crop damage', 'crop loss', 'farmer insurance', 'agricultural insurance', 'kisan credit card', 'farmer loan', 'krishi loan', 'crop insurance claim'],
-        'land_acquisition': ['land acquisition', 'government land', 'compensation', 'land acquired', 'land taken by government', 'acquisition compensation', 'land acquisition act', 'land compensation', 'eminent domain', 'compulsory acquisition', 'land acquisition case', 'adequate compensation', 'land acquisition procedure'],
-        
-        # ============ GENERAL LEGAL INFORMATION ============
-        'self_representation': ['represent myself', 'without lawyer', 'no lawyer', 'self representation', 'represent own case', 'fight own case', 'can i represent', 'do i need lawyer', 'represent self', 'without advocate', 'no advocate', 'fight case myself', 'handle case myself', 'pro se', 'in person representation', 'self represent', 'myself in court'],
-        'legal_procedure': ['file case', 'case procedure', 'court procedure', 'legal procedure', 'how to file', 'court process', 'legal process', 'case process', 'filing procedure', 'court filing', 'legal system', 'court system'],
-        'legal_aid': ['legal aid', 'free lawyer', 'free legal', 'nalsa', 'dlsa', 'legal services authority', 'free legal services', 'pro bono', 'government lawyer free'],
-    }
+    # One automaton pass; contexts are reported in QUERY_CONTEXT_PATTERNS order
+    if QUERY_CONTEXT_AUTOMATON is not None:
+        matched = set()
+        for _, context_names in QUERY_CONTEXT_AUTOMATON.iter(query_lower):
+            matched |= context_names
+        return tuple(name for name in QUERY_CONTEXT_PATTERNS if name in matched)
     
     # Detect all matching contexts
     detected_contexts = []
-    for context_name, patterns in context_patterns.items():
+    for context_name, patterns in QUERY_CONTEXT_PATTERNS.items():
         if any(pattern in query_lower for pattern in patterns):
             detected_contexts.append(context_name)
     
-    return detected_contexts
+    return tuple(detected_contexts)
 
-def calculate_contextual_score(query, entry, query_words, all_search_terms):
+def calculate_contextual_score(query, entry, query_words, all_search_terms, profile=None):
     """
     COMPREHENSIVE INTELLIGENT CONTEXT-AWARE SCORING FOR ALL 27 LAWS
     
@@ -7516,7 +7724,12 @@ def calculate_contextual_score(query, entry, query_words, all_search_terms):
     - "teacher beating student" → Education (Corporal Punishment section)
     - "both want divorce" → Family Law (Mutual Consent section)
     - "loan harassment" → Banking Law (Harassment section, NOT loan default)
+    
+    profile is the entry's precomputed EntryProfile (built here if omitted)
     """
+    if profile is None:
+        profile = EntryProfile(entry)
+    
     score = 0
     query_lower = query.lower()
     
@@ -7527,8 +7740,8 @@ def calculate_contextual_score(query, entry, query_words, all_search_terms):
     base_score = calculate_tfidf_score(all_search_terms, entry["keywords"])
     
     # CONTEXT-AWARE ADJUSTMENTS FOR ALL LEGAL CATEGORIES
-    category_lower = entry["category"].lower()
-    keywords_lower = ' '.join(entry["keywords"]).lower()
+    category_lower = profile.category_lower
+    keywords_lower = profile.keywords_lower
     
     # ============ CRIMINAL LAW ============
     if 'criminal' in category_lower:
@@ -7586,7 +7799,7 @@ def calculate_contextual_score(query, entry, query_words, all_search_terms):
         elif 'property_dispute' in query_contexts:
             score = base_score * 2.8  # STRONG BOOST for disputes
             # PENALTY if query is about dispute but entry is about registration
-            if 'registration' in ' '.join(entry["keywords"]).lower() and 'dispute' not in ' '.join(entry["keywords"]).lower():
+            if 'registration' in keywords_lower and 'dispute' not in keywords_lower:
                 score = base_score * 0.2  # STRONG PENALTY
         elif 'property_inheritance' in query_contexts:
             score = base_score * 2.3  # BOOST for inheritance
@@ -7797,21 +8010,20 @@ def calculate_contextual_score(query, entry, query_words, all_search_terms):
         score = base_score
     
     # Category word match bonus
-    category_words = category_lower.split()
-    for cat_word in category_words:
+    for cat_word in profile.category_words:
         if cat_word in all_search_terms and len(cat_word) > 3:
             score += 15
     
     # Exact phrase match bonus
-    for keyword in entry["keywords"]:
-        if len(keyword) > 5 and keyword.lower() in query_lower:
+    for keyword in profile.keywords:
+        if len(keyword) > 5 and keyword in query_lower:
             score += 30  # Increased bonus for exact matches
     
     # Main subject prominence (words in first half of query are more important)
     query_words_list = query_lower.split()
     first_half_words = query_words_list[:len(query_words_list)//2 + 1]
-    for keyword in entry["keywords"]:
-        if any(keyword.lower() in word for word in first_half_words):
+    for keyword in profile.keywords:
+        if any(keyword in word for word in first_half_words):
             score += 12  # Increased bonus for early word matches
     
     return score
@@ -7851,22 +8063,27 @@ def find_best_match(user_query):
     query_words = preprocessed_query.split()
     all_search_terms = query_words + list(expanded_terms)
     
+    # Encode the query once and score it against all entries in one product
+    query_embedding = encode_query(user_query)
+    semantic_scores = calculate_semantic_similarities(query_embedding)
+    
     best_match = None
     best_score = 0
     min_threshold = 10  # Adjusted threshold for better precision
     
     # Step 4: Score each knowledge entry with HYBRID APPROACH + NER
-    for entry in LEGAL_KNOWLEDGE:
+    for index, entry in enumerate(LEGAL_KNOWLEDGE):
         # Calculate contextual score (pattern matching - 70%)
         contextual_score = calculate_contextual_score(
             preprocessed_query, 
             entry, 
             query_words, 
-            all_search_terms
+            all_search_terms,
+            ENTRY_PROFILES[index]
         )
         
         # Calculate semantic similarity (embeddings - 30%)
-        semantic_score = calculate_semantic_similarity(user_query, entry["response"])
+        semantic_score = semantic_scores[index]
         # Normalize semantic score to 0-100 range
         semantic_score_normalized = semantic_score * 100
         
@@ -7883,10 +8100,8 @@ def find_best_match(user_query):
             best_match = entry
     
     # Step 5: Fallback to greeting if no good match
-    if best_score < min_threshold:
-        for entry in LEGAL_KNOWLEDGE:
-            if entry["category"] == "Greeting":
-                return entry
+    if best_score < min_threshold and BY_CATEGORY.get("Greeting"):
+        return BY_CATEGORY["Greeting"][0]
     
     return best_match
 
@@ -7983,12 +8198,75 @@ def detect_query_intent(query):
         return 'general', []
 
 
+# Inheritance query keywords -> scenario heading to extract
+INHERITANCE_SCENARIO_MAP = {
+    'succession certificate': 'SCENARIO 10',
+    'joint succession': 'SCENARIO 10',
+    'adopted child': 'SCENARIO 9',
+    'adoption rights': 'SCENARIO 9',
+    'electricity bill': 'ownership',
+    'utility bill': 'ownership',
+    'property document': 'ownership',
+    'legal heir certificate': 'SCENARIO 2',
+    'noc refusal': 'SCENARIO 4',
+    'noc not given': 'SCENARIO 4',
+    'missing will': 'SCENARIO 5',
+    'handwritten will': 'SCENARIO 15',
+    'ancestral land': 'SCENARIO 6',
+    'stepchildren': 'SCENARIO 7',
+    'widow rights': 'SCENARIO 8',
+    'digital assets': 'SCENARIO 10',
+    'joint ownership': 'SCENARIO 11',
+    'forged documents': 'SCENARIO 12',
+    'mutation delay': 'SCENARIO 13',
+    'daughter rights': 'SCENARIO 14',
+}
+
+# Fixed footer blocks appended by extract_relevant_section (built once)
+SCENARIO_OVERVIEW_FOOTER = (
+    '',
+    '---',
+    '## 📋 Available Scenarios (Ask me about any specific scenario):',
+    '',
+    '1. Sibling Dispute - Property division after parents death',
+    '2. Transfer Property Without Will',
+    '3. Succession Certificate & Digital Assets',
+    '4. Adopted Child Rights',
+    '5. Handwritten Will Validity',
+    '6. And many more...',
+    '',
+    '**Ask me a specific question to get detailed guidance!**',
+)
+
+COMPLEX_TOPIC_FOOTER = (
+    '',
+    '---',
+    '',
+    '**💡 This is a complex topic with multiple scenarios.**',
+    '',
+    '**Please ask a more specific question, such as:**',
+    '- "How to get succession certificate?"',
+    '- "What are adopted child property rights?"',
+    '- "Is electricity bill proof of ownership?"',
+    '- "Can I challenge a handwritten will?"',
+    '',
+)
+
+@lru_cache(maxsize=None)
+def split_response_lines(response_text):
+    """
+    Split a knowledge base response into lines (cached per response)
+    Responses are fixed, so each one is split once instead of per query
+    Returns an immutable tuple so cached results cannot be modified
+    """
+    return tuple(response_text.split('\n'))
+
 def extract_relevant_section(response_text, intent, priority_keywords):
     """
     Extract ONLY the most relevant section based on query intent
     This ensures users get exactly what they asked for
     """
-    lines = response_text.split('\n')
+    lines = split_response_lines(response_text)
     result_lines = []
     
     # Always include main title (only once!)
@@ -8243,30 +8521,6 @@ def extract_relevant_section(response_text, intent, priority_keywords):
          ('inheritance' in response_text.lower() and 'scenario' in response_text.lower()):
         query_lower = response_text.lower()
         
-        # Map query keywords to specific scenarios
-        scenario_map = {
-            'succession certificate': 'SCENARIO 10',
-            'joint succession': 'SCENARIO 10',
-            'adopted child': 'SCENARIO 9',
-            'adoption rights': 'SCENARIO 9',
-            'electricity bill': 'ownership',
-            'utility bill': 'ownership',
-            'property document': 'ownership',
-            'legal heir certificate': 'SCENARIO 2',
-            'noc refusal': 'SCENARIO 4',
-            'noc not given': 'SCENARIO 4',
-            'missing will': 'SCENARIO 5',
-            'handwritten will': 'SCENARIO 15',
-            'ancestral land': 'SCENARIO 6',
-            'stepchildren': 'SCENARIO 7',
-            'widow rights': 'SCENARIO 8',
-            'digital assets': 'SCENARIO 10',
-            'joint ownership': 'SCENARIO 11',
-            'forged documents': 'SCENARIO 12',
-            'mutation delay': 'SCENARIO 13',
-            'daughter rights': 'SCENARIO 14',
-        }
-        
         # Find matching scenario from user query
         # priority_keywords contains the original query as last element
         user_query_lower = ''
@@ -8277,7 +8531,7 @@ def extract_relevant_section(response_text, intent, priority_keywords):
         print(f"[DEBUG] Inheritance query detected: {user_query_lower[:100]}")
         
         matched_scenario = None
-        for keyword, scenario in scenario_map.items():
+        for keyword, scenario in INHERITANCE_SCENARIO_MAP.items():
             if keyword in user_query_lower:
                 matched_scenario = scenario
                 print(f"[DEBUG] Matched scenario: {scenario} for keyword: {keyword}")
@@ -8334,18 +8588,7 @@ def extract_relevant_section(response_text, intent, priority_keywords):
                 if stripped.startswith('## 🎯 **SCENARIO'):
                     in_overview = False
                     # Add a note about available scenarios
-                    result_lines.append('')
-                    result_lines.append('---')
-                    result_lines.append('## 📋 Available Scenarios (Ask me about any specific scenario):')
-                    result_lines.append('')
-                    result_lines.append('1. Sibling Dispute - Property division after parents death')
-                    result_lines.append('2. Transfer Property Without Will')
-                    result_lines.append('3. Succession Certificate & Digital Assets')
-                    result_lines.append('4. Adopted Child Rights')
-                    result_lines.append('5. Handwritten Will Validity')
-                    result_lines.append('6. And many more...')
-                    result_lines.append('')
-                    result_lines.append('**Ask me a specific question to get detailed guidance!**')
+                    result_lines.extend(SCENARIO_OVERVIEW_FOOTER)
                     break
                 
                 if in_overview:
@@ -8369,28 +8612,15 @@ def extract_relevant_section(response_text, intent, priority_keywords):
     
     # If nothing found, return first part of response
     if len(result_lines) < 10:
-        result_lines = lines[:50]
+        result_lines = list(lines[:50])
     
     # SAFETY CHECK: If response is too long (>1200 chars) and contains SCENARIO, truncate intelligently
     result_text = '\n'.join(result_lines)
     if len(result_text) > 1200 and 'SCENARIO' in result_text:
         print(f"[DEBUG] Response too long ({len(result_text)} chars), truncating...")
         # Keep only title + first scenario or show summary
-        truncated_lines = []
-        for line in result_lines[:50]:  # First 50 lines max
-            truncated_lines.append(line)
-        
-        truncated_lines.append('')
-        truncated_lines.append('---')
-        truncated_lines.append('')
-        truncated_lines.append('**💡 This is a complex topic with multiple scenarios.**')
-        truncated_lines.append('')
-        truncated_lines.append('**Please ask a more specific question, such as:**')
-        truncated_lines.append('- "How to get succession certificate?"')
-        truncated_lines.append('- "What are adopted child property rights?"')
-        truncated_lines.append('- "Is electricity bill proof of ownership?"')
-        truncated_lines.append('- "Can I challenge a handwritten will?"')
-        truncated_lines.append('')
+        truncated_lines = result_lines[:50]  # First 50 lines max
+        truncated_lines.extend(COMPLEX_TOPIC_FOOTER)
         result_lines = truncated_lines
     
     # Always add citations at the end